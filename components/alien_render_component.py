@@ -2,6 +2,11 @@ import pygame
 from components.render_component import RenderComponent
 
 class AlienRenderComponent(RenderComponent):
+    # Aliens only differ by color and state, so every alien shares one set of
+    # drawn sprites at the current zoom, see _get_sprite
+    _sprite_zoom = None
+    _sprites = {}  # (color, is corpse, width, height) -> Surface
+
     def __init__(self, entity, color=(255, 192, 203, 128)):  # Pink with alpha
         super().__init__(entity, color)
         self.selected = False
@@ -23,13 +28,52 @@ class AlienRenderComponent(RenderComponent):
         screen_x = (self.entity.position.x - camera_x) * zoom_level
         screen_y = (self.entity.position.y - camera_y) * zoom_level
         
-        # Create a surface with alpha for the alien scaled by zoom
+        # Size of the alien scaled by zoom
         scaled_size = pygame.Vector2(self.entity.size.x * zoom_level, 
                                    self.entity.size.y * zoom_level)
+        
+        # Skip aliens that are fully off-screen, allowing for the selection
+        # circle, which reaches 0.75 of the width out from the center
+        reach = max(scaled_size.x, scaled_size.y)
+        if (screen_x + reach < 0 or screen_x - reach > surface.get_width() or
+                screen_y + reach < 0 or screen_y - reach > surface.get_height()):
+            return
+        is_corpse = bool(self.entity.health and self.entity.health.is_corpse)
+        alien_surface = self._get_sprite(is_corpse, scaled_size, zoom_level)
+        
+        # Blit the alien to the screen
+        surface.blit(alien_surface,
+                    (screen_x - scaled_size.x/2,
+                     screen_y - scaled_size.y/2))
+        
+        # Draw selection circle when selected
+        if self.selected:
+            pygame.draw.circle(surface, (255, 255, 0),
+                             (int(screen_x), int(screen_y)),
+                             int(scaled_size.x * 0.75), 
+                             max(1, int(2 * zoom_level))) 
+
+    def _get_sprite(self, is_corpse, scaled_size, zoom_level):
+        """Get the alien drawn at a zoom level, drawing it on first use"""
+        cls = AlienRenderComponent
+        if zoom_level != cls._sprite_zoom:
+            cls._sprites.clear()
+            cls._sprite_zoom = zoom_level
+        key = (self.color, is_corpse, scaled_size.x, scaled_size.y)
+        sprite = cls._sprites.get(key)
+        if sprite is None:
+            # Match the display format once, so each blit takes the fast path
+            sprite = self._draw_sprite(is_corpse, scaled_size, zoom_level).convert_alpha()
+            cls._sprites[key] = sprite
+        return sprite
+
+    def _draw_sprite(self, is_corpse, scaled_size, zoom_level):
+        """Draw the alien's body, eyes and tentacles onto a new surface"""
+        # Create a surface with alpha for the alien scaled by zoom
         alien_surface = pygame.Surface((scaled_size.x, scaled_size.y), pygame.SRCALPHA)
         
         # Modify color if dead
-        if self.entity.health and self.entity.health.is_corpse:
+        if is_corpse:
             # Desaturate and darken the color for dead state
             dead_color = (
                 min(255, self.color[0] * 0.5),
@@ -51,7 +95,7 @@ class AlienRenderComponent(RenderComponent):
                          (scaled_size.x/2, scaled_size.y * 0.3),
                          head_size/2)
         
-        if self.entity.health and self.entity.health.is_corpse:
+        if is_corpse:
             # Draw X eyes for dead state
             eye_size = head_size * 0.3
             eye_y = scaled_size.y * 0.25
@@ -107,7 +151,7 @@ class AlienRenderComponent(RenderComponent):
         tentacle_color = tuple(max(0, min(255, c + 30)) for c in render_color[:3]) + (render_color[3],)
         for i in range(3):
             start_x = scaled_size.x * (0.3 + 0.2 * i)
-            if self.entity.health and self.entity.health.is_corpse:
+            if is_corpse:
                 # Droopy curved tentacles for dead state
                 control_x = start_x + scaled_size.x * 0.1
                 end_x = start_x + scaled_size.x * 0.15
@@ -124,14 +168,4 @@ class AlienRenderComponent(RenderComponent):
                                (start_x, scaled_size.y),
                                max(1, int(3 * zoom_level)))
         
-        # Blit the alien to the screen
-        surface.blit(alien_surface,
-                    (screen_x - scaled_size.x/2,
-                     screen_y - scaled_size.y/2))
-        
-        # Draw selection circle when selected
-        if self.selected:
-            pygame.draw.circle(surface, (255, 255, 0),
-                             (int(screen_x), int(screen_y)),
-                             int(scaled_size.x * 0.75), 
-                             max(1, int(2 * zoom_level))) 
\ No newline at end of file
+        return alien_surface
@@ -9,6 +9,8 @@ class Component(ABC):
     Base class for all entity components.
     Components encapsulate specific behaviors or attributes that can be attached to entities.
     """
+    __slots__ = ('entity', 'active')
+
     def __init__(self, entity: 'Entity'):
         self.entity = entity
         self.active = True
@@ -15,6 +15,7 @@ class Entity:
         
         # Component management - store by both type and name
         self.components: Dict[str, Component] = {}
+        self._components_by_type: Dict[Type[Component], Component] = {}
         
         # Basic properties
         self.color = WHITE
@@ -42,6 +43,7 @@ class Entity:
             raise ValueError(f"Component of type {component_name} already exists")
         
         self.components[component_name] = component
+        self._components_by_type[component.__class__] = component
         return component
 
     def get_component(self, component_type: Union[Type[Component], str]) -> Component:
@@ -59,7 +61,7 @@ class Entity:
         """
         if isinstance(component_type, str):
             return self.components[component_type]
-        return self.components[component_type.__name__]
+        return self._components_by_type[component_type]
 
     def has_component(self, component_type: Union[Type[Component], str]) -> bool:
         """
@@ -73,7 +75,7 @@ class Entity:
         """
         if isinstance(component_type, str):
             return component_type in self.components
-        return component_type.__name__ in self.components
+        return component_type in self._components_by_type
 
     def update(self, dt: float) -> None:
         """
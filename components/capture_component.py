@@ -101,7 +101,7 @@ class CaptureComponent(Component):
     def update(self, dt: float) -> None:
         """Update carried target position"""
         if self.carrying_target:
-            self.carrying_target.position = self.entity.position
+            self.carrying_target.position = self.entity.position.copy()
 
     def render(self, surface, camera_x: float, camera_y: float) -> None:
         """Draw capture range and status indicators"""
@@ -6,7 +6,7 @@ from components.pathfinding_component import PathfindingComponent
 from components.task_component import TaskComponent
 from utils.types import EntityState, TaskType
 from entities.items.food import Food
-from utils.config import TILE_SIZE
+from utils.config import TILE_SIZE, TILE_SIZE_LOG2
 import pygame
 from typing import Optional
 import math
@@ -46,7 +46,7 @@ class CatAIComponent(Component):
 
         # Handle food seeking state
         if self.state == EntityState.SEEKING_FOOD:
-            if not self._movement.moving:
+            if not self._movement.moving and not self._pathfinding.pending:
                 # Check if we're near food
                 nearest_food = self._find_nearest_food()
                 if nearest_food and self._is_near_food(nearest_food):
@@ -79,16 +79,14 @@ class CatAIComponent(Component):
             if self._task._is_at_task_position():
                 if self._movement.moving:
                     self._movement.stop()  # Force stop when in position
-                    return
                 
-                # Update task progress
-                if self._task.update(dt):  # Task completed
-                    self._movement.allow_movement()  # Allow movement again
-                    self._change_state(EntityState.WANDERING)
+                # TaskComponent.update does the work; once the task is done
+                # has_task() turns False and we go back to wandering above
                 return
 
             # If not at task position and not moving, try to move there
-            if not self._movement.moving:
+            # (unless a background search for the route is still running)
+            if not self._movement.moving and not self._pathfinding.pending:
                 task_pos = self._task.get_task_position()
                 if not task_pos:
                     self._change_state(EntityState.WANDERING)
@@ -105,12 +103,6 @@ class CatAIComponent(Component):
         """Attempt to find and claim a task"""
         task = self.entity.game_state.task_system.get_available_task(self.entity)
         if task:
-            # Convert current position to tile coordinates
-            current_pos = (
-                int(self.entity.position.x / TILE_SIZE),
-                int(self.entity.position.y / TILE_SIZE)
-            )
-            
             # Try to find path to task
             path = self._pathfinding.set_target(
                 task.position[0] * TILE_SIZE + TILE_SIZE/2,
@@ -135,8 +127,9 @@ class CatAIComponent(Component):
 
     def _is_near_food(self, food_item: Food) -> bool:
         """Check if we're close enough to eat the food"""
-        distance = (food_item.position - self.entity.position).length()
-        return distance < TILE_SIZE * 1.5  # Within 1.5 tiles
+        # Compare squared distances to skip the sqrt
+        distance_sq = self.entity.position.distance_squared_to(food_item.position)
+        return distance_sq < (TILE_SIZE * 1.5) ** 2  # Within 1.5 tiles
 
     def _find_nearest_food(self) -> Optional[Food]:
         """Find the nearest accessible food item"""
@@ -145,7 +138,7 @@ class CatAIComponent(Component):
         
         for item in self.entity.game_state.current_level.entity_manager.items:
             if isinstance(item, Food):
-                distance = (item.position - self.entity.position).length()
+                distance = self.entity.position.distance_squared_to(item.position)
                 if distance < min_distance:
                     # Check if we can path to this food
                     if self._pathfinding.can_reach(item.position.x, item.position.y):
@@ -160,8 +153,8 @@ class CatAIComponent(Component):
             return
         
         # Get current position in tiles
-        current_x = int(self.entity.position.x / TILE_SIZE)
-        current_y = int(self.entity.position.y / TILE_SIZE)
+        current_x = int(self.entity.position.x) >> TILE_SIZE_LOG2
+        current_y = int(self.entity.position.y) >> TILE_SIZE_LOG2
                 
         # Try increasingly larger areas until valid path found
         for radius in [2, 3, 4]:
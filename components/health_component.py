@@ -40,6 +40,8 @@ class HealthComponent(Component):
             self.entity.ai.enabled = False
         if hasattr(self.entity, 'task'):
             self.entity.task.enabled = False
+            # A dead worker's task range no longer needs checking each frame
+            self.entity.game_state.task_system.unregister_worker(self.entity.task)
         if hasattr(self.entity, 'pathfinding'):
             self.entity.pathfinding.enabled = False
 
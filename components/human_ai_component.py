@@ -87,7 +87,8 @@ class HumanAIComponent(Component):
 
     def _handle_patrol_state(self) -> None:
         """Handle patrol behavior"""
-        if not self._movement.moving and hasattr(self.entity, 'patrol_points'):
+        if (not self._movement.moving and not self._pathfinding.pending and
+                hasattr(self.entity, 'patrol_points')):
             if self.entity.patrol_points:
                 current_point = self.entity.patrol_points[self.entity.current_patrol_index]
                 target_x = (current_point[0] + 0.5) * TILE_SIZE
@@ -11,14 +11,20 @@ class MovementComponent(Component):
         self.moving = False
         self.position = pygame.math.Vector2(entity.position)
         self._pathfinding = None
+        self._waypoint_callback = None  # Bound once in start() to skip per-arrival lookups
         self._force_stop = False  # New flag to prevent movement
 
     def start(self) -> None:
         """Get reference to pathfinding component"""
         from components.pathfinding_component import PathfindingComponent
         self._pathfinding = self.entity.get_component(PathfindingComponent)
+        self._waypoint_callback = self._pathfinding.waypoint_reached if self._pathfinding else None
         self._force_stop = False
         self.moving = False
+        
+        # Positions are mutated in place, so make sure we own a Vector2
+        if not isinstance(self.entity.position, pygame.math.Vector2):
+            self.entity.position = pygame.math.Vector2(self.entity.position)
 
     @property
     def path(self) -> list:
@@ -76,8 +82,9 @@ class MovementComponent(Component):
             return
 
         # Calculate movement with interpolation
-        direction = self.target_position - self.position
-        distance = direction.length()
+        target = self.target_position
+        position = self.position
+        distance = position.distance_to(target)
         
         if distance < 1.0:
             self._handle_arrival()
@@ -86,9 +93,10 @@ class MovementComponent(Component):
             t = min(1.0, (self.speed * dt) / distance)
             t = self._ease_out_quad(t)  # Smooth deceleration
             
-            # Interpolate position
-            self.position = self.position.lerp(self.target_position, t)
-            self.entity.position = pygame.math.Vector2(self.position)
+            # Interpolate position in place to avoid per-frame Vector2 allocations
+            position.x += (target.x - position.x) * t
+            position.y += (target.y - position.y) * t
+            self.entity.position.update(position)
 
     def _ease_out_quad(self, t: float) -> float:
         """Quadratic easing for smoother movement"""
@@ -110,11 +118,11 @@ class MovementComponent(Component):
 
     def _handle_arrival(self) -> None:
         """Handle entity arrival at target position"""
-        self.position = pygame.math.Vector2(self.target_position)
-        self.entity.position = pygame.math.Vector2(self.position)
+        self.position.update(self.target_position)
+        self.entity.position.update(self.position)
         self.moving = False
         self.target_position = None
         
         # Notify pathfinding component if it exists
-        if self._pathfinding:
-            self._pathfinding.waypoint_reached() 
\ No newline at end of file
+        if self._waypoint_callback is not None:
+            self._waypoint_callback()
\ No newline at end of file
@@ -1,12 +1,19 @@
+import logging
 import pygame
+from concurrent.futures import ThreadPoolExecutor
 from components.base_component import Component
 from typing import TYPE_CHECKING
-from utils.config import TILE_SIZE
-from utils.pathfinding import find_path
+from utils.config import TILE_SIZE, TILE_SIZE_LOG2, PATHFINDING_BIDI_THRESHOLD, DEBUG_DRAW_PATHS
+from utils.pathfinding import find_path, find_path_bidi, manhattan_distance, WalkableGrid
 
 if TYPE_CHECKING:
     from components.movement_component import MovementComponent
 
+log = logging.getLogger(__name__)
+
+# Shared worker pool so long A* searches don't stall the frame
+_PATH_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix='pathfinding')
+
 class PathfindingComponent(Component):
     def __init__(self, entity):
         super().__init__(entity)
@@ -14,6 +21,7 @@ class PathfindingComponent(Component):
         self._movement = None
         self.tile_size = TILE_SIZE
         self.current_waypoint = 0
+        self._pending_path = None  # Future for an in-flight background search
 
     def start(self) -> None:
         """Get reference to movement component"""
@@ -27,23 +35,26 @@ class PathfindingComponent(Component):
 
         # Convert pixel coordinates to tile coordinates
         current_tile = (
-            int(self.entity.position.x // self.tile_size),
-            int(self.entity.position.y // self.tile_size)
+            int(self.entity.position.x) >> TILE_SIZE_LOG2,
+            int(self.entity.position.y) >> TILE_SIZE_LOG2
         )
         target_tile = (
-            int(target_x // self.tile_size),
-            int(target_y // self.tile_size)
+            int(target_x) >> TILE_SIZE_LOG2,
+            int(target_y) >> TILE_SIZE_LOG2
         )
 
-        # Check if target tile is occupied by another entity
+        # Check if target tile is occupied by another entity, noting the
+        # other entities' tiles for a background search
+        occupied = []
         for entity in self.entity.game_state.entity_manager.entities:
             if entity != self.entity:  # Don't check against self
                 entity_tile = (
-                    int(entity.position.x // self.tile_size),
-                    int(entity.position.y // self.tile_size)
+                    int(entity.position.x) >> TILE_SIZE_LOG2,
+                    int(entity.position.y) >> TILE_SIZE_LOG2
                 )
                 if entity_tile == target_tile:
                     return False
+                occupied.append(entity_tile)
 
         # Get tilemap and dimensions
         tilemap = self.entity.game_state.current_level.tilemap
@@ -62,14 +73,31 @@ class PathfindingComponent(Component):
         # Clear existing path
         self.clear_path()
 
+        # Long searches run on the worker pool against snapshots of the map,
+        # entity tiles and other entities' reservations, so the worker reads
+        # nothing the main thread changes; update() reserves and applies the
+        # result. Others sharing our start tile don't block us, as in
+        # _is_tile_occupied.
+        if self._is_long_path(current_tile, target_tile):
+            path_system = getattr(self.entity.game_state, 'path_reservation_system', None)
+            reserved = frozenset(
+                tile for tile, owner in path_system.reserved_tiles.items() if owner != self.entity
+            ) if path_system else frozenset()
+            self._pending_path = _PATH_POOL.submit(
+                find_path_bidi,
+                current_tile,
+                target_tile,
+                WalkableGrid(tilemap.walkable.copy()),
+                None,
+                self.entity,
+                frozenset(tile for tile in occupied if tile != current_tile),
+                False,
+                reserved
+            )
+            return True
+
         # Find path using A*
-        self.path = find_path(
-            current_tile,
-            target_tile,
-            self.entity.game_state.current_level.tilemap,
-            self.entity.game_state,
-            self.entity
-        )
+        self.path = self._find_path(current_tile, target_tile, tilemap) or []
 
         if self.path:
             self.current_waypoint = 0
@@ -84,7 +112,7 @@ class PathfindingComponent(Component):
             self.current_waypoint += 1
             self._set_next_waypoint()
         else:
-            self.path = None
+            self.path = []
             self.current_waypoint = 0
 
     def _set_next_waypoint(self) -> None:
@@ -93,8 +121,8 @@ class PathfindingComponent(Component):
             return
 
         next_tile = self.path[self.current_waypoint]
-        pixel_x = next_tile[0] * self.tile_size + (self.tile_size // 2)
-        pixel_y = next_tile[1] * self.tile_size + (self.tile_size // 2)
+        pixel_x = (next_tile[0] << TILE_SIZE_LOG2) + (TILE_SIZE >> 1)
+        pixel_y = (next_tile[1] << TILE_SIZE_LOG2) + (TILE_SIZE >> 1)
         self._movement.set_target_position(float(pixel_x), float(pixel_y))
 
     def update(self, dt: float) -> None:
@@ -103,6 +131,10 @@ class PathfindingComponent(Component):
             from components.movement_component import MovementComponent
             self._movement = self.entity.get_component(MovementComponent)
 
+        # Collect a finished background search
+        if self._pending_path and self._pending_path.done():
+            self._collect_pending_path()
+
         if not self.path or not self._movement:
             return
 
@@ -113,10 +145,12 @@ class PathfindingComponent(Component):
             self._set_next_waypoint()
         elif not self._movement.moving:
             # Path completed
-            self.path = None
+            self.path = []
 
     def render(self, surface, camera_x: float, camera_y: float) -> None:
         """Draw the path for debugging"""
+        if not DEBUG_DRAW_PATHS:
+            return
         if self.path and len(self.path) > self.current_waypoint:
             zoom = self.entity.game_state.zoom_level
             # Draw lines between waypoints
@@ -135,8 +169,39 @@ class PathfindingComponent(Component):
                                ((end_pos[0] - camera_x) * zoom,
                                 (end_pos[1] - camera_y) * zoom), 2)
 
+    @property
+    def pending(self) -> bool:
+        """Whether a background search is still running for this entity"""
+        return self._pending_path is not None
+
+    def _collect_pending_path(self) -> None:
+        """Reserve and follow a finished background path, or fail the target"""
+        try:
+            path = self._pending_path.result()
+        except Exception:
+            log.exception("Background path search failed for %r", self.entity)
+            path = None
+        self._pending_path = None
+
+        path_system = getattr(self.entity.game_state, 'path_reservation_system', None)
+        if path and (not path_system or path_system.reserve_path(self.entity, path)):
+            self.path = path
+            self.current_waypoint = 0
+            self._set_next_waypoint()
+            return
+
+        # Same outcome as set_target returning False: give up the task
+        from components.task_component import TaskComponent
+        if self.entity.has_component(TaskComponent):
+            self.entity.get_component(TaskComponent).stop()
+
     def clear_path(self) -> None:
         """Clear current path and reset state"""
+        if self._pending_path:
+            # Drop any in-flight search; its result is never collected, and
+            # the worker doesn't reserve, so it can't touch our reservations
+            self._pending_path.cancel()
+            self._pending_path = None
         if self.path:
             self.path = []
             self.current_waypoint = 0
@@ -147,12 +212,12 @@ class PathfindingComponent(Component):
     def can_reach(self, target_x: float, target_y: float) -> bool:
         """Check if a path exists to target position"""
         current_tile = (
-            int(self.entity.position.x // self.tile_size),
-            int(self.entity.position.y // self.tile_size)
+            int(self.entity.position.x) >> TILE_SIZE_LOG2,
+            int(self.entity.position.y) >> TILE_SIZE_LOG2
         )
         target_tile = (
-            int(target_x // self.tile_size),
-            int(target_y // self.tile_size)
+            int(target_x) >> TILE_SIZE_LOG2,
+            int(target_y) >> TILE_SIZE_LOG2
         )
 
         tilemap = self.entity.game_state.current_level.tilemap
@@ -163,12 +228,21 @@ class PathfindingComponent(Component):
         if not tilemap.is_walkable(*target_tile):
             return False
 
-        path = find_path(
+        path = self._find_path(current_tile, target_tile, tilemap)
+        
+        return path is not None
+
+    def _is_long_path(self, current_tile, target_tile) -> bool:
+        """Check if a query is long enough for the bidirectional search"""
+        return manhattan_distance(current_tile, target_tile) > PATHFINDING_BIDI_THRESHOLD
+
+    def _find_path(self, current_tile, target_tile, tilemap):
+        """Run A*, switching to the bidirectional search for long paths"""
+        search = find_path_bidi if self._is_long_path(current_tile, target_tile) else find_path
+        return search(
             current_tile,
             target_tile,
             tilemap,
             self.entity.game_state,
             self.entity
         )
-        
-        return path is not None
\ No newline at end of file
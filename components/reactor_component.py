@@ -28,10 +28,6 @@ class ReactorComponent(Component):
                 if self.entity and self.entity.game_state:
                     tilemap = self.entity.game_state.current_level.tilemap
                     tilemap.set_walkable(base_x + dx, base_y + dy, False)
-                    
-        # Register with power system when built
-        if self.entity and self.entity.game_state:
-            self.entity.game_state.power_system.register_power_source(self)
         
     def cleanup(self):
         """Called when component is removed/destroyed"""
@@ -64,4 +60,11 @@ class ReactorComponent(Component):
                 
                 # Register with power system when construction completes
                 if self.entity and self.entity.game_state:
-                    self.entity.game_state.power_system.register_power_source(self) 
\ No newline at end of file
+                    self.entity.game_state.power_system.register_power_source(self)
+                
+                # Nothing left to update once built
+                self.update = self._update_built
+
+    def _update_built(self, dt: float) -> None:
+        """No-op update installed after construction completes"""
+        pass
@@ -2,12 +2,25 @@ import pygame
 from components.base_component import Component
 
 class RenderComponent(Component):
+    RADIUS = 16
+
     def __init__(self, entity, color=(255, 0, 0)):
         super().__init__(entity)
         self.color = color
 
+        # Circle pre-rendered on first use at the current zoom, so render() is
+        # a single blit; subclasses that draw themselves never build it
+        self._circle = None
+        self._circle_zoom = None
+
     def render(self, surface, camera_x: float, camera_y: float) -> None:
-        pygame.draw.circle(surface, self.color,
-                         (int(self.entity.position.x),
-                          int(self.entity.position.y)),
-                         16)  # radius 
\ No newline at end of file
+        zoom_level = getattr(self.entity.game_state, 'zoom_level', 1)
+        radius = max(1, int(self.RADIUS * zoom_level))
+        if self._circle_zoom != zoom_level:
+            self._circle = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(self._circle, self.color, (radius, radius), radius)
+            self._circle_zoom = zoom_level
+
+        surface.blit(self._circle,
+                     (int((self.entity.position.x - camera_x) * zoom_level) - radius,
+                      int((self.entity.position.y - camera_y) * zoom_level) - radius))
@@ -4,16 +4,47 @@ from utils.types import EntityState, TaskType
 import pygame
 from utils.config import TILE_SIZE
 
+_INV_TILE = 1.0 / TILE_SIZE
+
 class TaskComponent(Component):
+    WORKING_RADIUS = 2.0  # Tiles (Manhattan) to start working
+    STICKY_RADIUS = 2.2  # Tiles (Manhattan) before an in-range worker drops out
+
+    # Progress bar geometry in unzoomed pixels
+    BAR_WIDTH = 40
+    BAR_HEIGHT = 5
+    BAR_OFFSET_Y = 30  # Above the entity's center
+    BAR_STEPS = 20  # Fill levels the bar is quantized to
+    
+    # Pre-rendered bars keyed by (fill step, width, height), shared by all tasks
+    _bar_cache = {}
+
+    # Update handler method per task type, keyed by TaskType name (TaskType isn't hashable)
+    _UPDATE_HANDLERS = {
+        TaskType.WIRE_CONSTRUCTION.name: '_update_wire_construction',
+    }
+
+    __slots__ = ('current_task', '_movement', '_task_position', '_work_time',
+                 '_task_complete', '_is_building', '_last_in_range', '_in_range_cache',
+                 '_update_handler', '_game_state', '_task_system', '_wire_system',
+                 'enabled')  # enabled is cleared by HealthComponent on death
+
     def __init__(self, entity):
         super().__init__(entity)
         self.current_task = None
         self._movement = None
         self._task_position = None
-        self._work_progress = 0
-        self._work_time = 2.0  # Default work time
+        self._work_time = 1.0  # Default work time
         self._task_complete = False
         self._is_building = False
+        self._last_in_range = False
+        self._in_range_cache = (-1, 0.0, 0.0, False)  # (frame, x, y, in range) from the last check
+        self._update_handler = self._update_idle
+        
+        # Game-wide systems, cached when a task starts
+        self._game_state = None
+        self._task_system = None
+        self._wire_system = None
 
     def start(self) -> None:
         """Get reference to movement component"""
@@ -34,13 +65,18 @@ class TaskComponent(Component):
             
         self.current_task = task
         self._task_position = task.position
-        self._work_progress = 0
-        self._work_time = getattr(task, 'work_time', 2.0)
+        self._in_range_cache = (-1, 0.0, 0.0, False)
+        self._work_time = task.work_time
         
         # Now actually assign and remove from available pool
         task.assign_to(self.entity)
-        if task in self.entity.game_state.task_system.available_tasks:
-            self.entity.game_state.task_system.available_tasks.remove(task)
+        game_state = self.entity.game_state
+        self._game_state = game_state
+        self._task_system = game_state.task_system
+        self._wire_system = game_state.wire_system
+        self._task_system.remove_available(task)
+        self._task_system.register_worker(self)
+        self._set_update_handler()
         
         return True
 
@@ -48,12 +84,13 @@ class TaskComponent(Component):
         """Stop current task"""
         if self.current_task:
             # Return task to system for reassignment
-            self.entity.game_state.task_system.return_task(self.current_task)
+            self._task_system.return_task(self.current_task)
+            self._task_system.unregister_worker(self)
             self.current_task = None
             self._task_position = None
-            self._work_progress = 0
             self._task_complete = False
             self._is_building = False
+            self._set_update_handler()
 
     def get_task_position(self) -> tuple[int, int]:
         """Get current task position in tile coordinates"""
@@ -61,36 +98,36 @@ class TaskComponent(Component):
 
     def update(self, dt: float) -> bool:
         """Update task progress"""
-        if not self.current_task:
-            return False
-        
-        # Only handle wire construction tasks
-        if self.current_task.type != TaskType.WIRE_CONSTRUCTION:
-            return False
-        
+        return self._update_handler(dt)
+
+    def _set_update_handler(self) -> None:
+        """Pick the update handler for the current task type"""
+        name = '_update_idle'
+        if self.current_task:
+            name = self._UPDATE_HANDLERS.get(self.current_task.type.name, name)
+        self._update_handler = getattr(self, name)
+
+    def _update_idle(self, dt: float) -> bool:
+        """Update handler when there is no task we know how to work on"""
+        return False
+
+    def _update_wire_construction(self, dt: float) -> bool:
+        """Update handler for wire construction tasks"""
         # Check if we're at the task position
         if not self._is_at_task_position():
             return False
         
         # Start construction if not already building
-        if not self._is_building:
-            self._is_building = True
-        
-        # Update work progress
-        old_progress = self._work_progress
-        self._work_progress += dt
-        
-        # Update wire construction progress in wire system
-        wire_system = self.entity.game_state.wire_system
-        if not wire_system.update_construction_progress(self._task_position, dt):
-            return False
+        self._is_building = True
         
-        if self._work_progress >= self._work_time:
-            if not wire_system.complete_wire_construction(self._task_position):
-                return False
+        # The wire system owns construction progress; we just report work
+        # and finish the task once the wire is built
+        wire_system = self._wire_system
+        if wire_system.is_wire_built(self._task_position):
             self._complete_task()
             return True
         
+        wire_system.work_on(self._task_position, self._work_time)
         return False
 
     def _is_at_task_position(self) -> bool:
@@ -98,24 +135,34 @@ class TaskComponent(Component):
         if not self._task_position:
             return False
             
-        # Convert pixel coordinates to tile coordinates
-        cat_x = self.entity.position.x / TILE_SIZE
-        cat_y = self.entity.position.y / TILE_SIZE
+        # Reuse the result if we already checked this frame from the same spot
+        # (TaskSystem.batch_update fills this in ahead of the entity's movement)
+        frame = self._game_state.frame
+        x, y = self.entity.position.x, self.entity.position.y
+        cache = self._in_range_cache
+        if cache[0] == frame and cache[1] == x and cache[2] == y:
+            self._last_in_range = cache[3]
+            return cache[3]
+            
+        # Convert pixel coordinates to fractional tile coordinates; the radii are
+        # tuned against the sub-tile offset, so this can't be an integer shift
+        cat_x = x * _INV_TILE
+        cat_y = y * _INV_TILE
         
         # Get task center in tile coordinates
         task_x = self._task_position[0]
         task_y = self._task_position[1]
         
-        # Calculate Manhattan distance (grid-based distance)
+        # Calculate Manhattan distance (grid-based distance, no sqrt needed)
         manhattan_dist = abs(task_x - cat_x) + abs(task_y - cat_y)
         
-        # More lenient range check and "sticky" behavior
-        is_in_range = manhattan_dist <= 2.0
-        if hasattr(self, '_last_in_range') and self._last_in_range:
-            # If we were in range before, be more lenient about leaving
-            is_in_range = manhattan_dist <= 2.2
+        # More lenient range check and "sticky" behavior: if we were in range
+        # before, be more lenient about leaving
+        radius = self.STICKY_RADIUS if self._last_in_range else self.WORKING_RADIUS
+        is_in_range = manhattan_dist <= radius
         
         self._last_in_range = is_in_range
+        self._in_range_cache = (frame, x, y, is_in_range)
         return is_in_range
 
     def _complete_task(self) -> None:
@@ -123,11 +170,12 @@ class TaskComponent(Component):
         if not self.current_task:
             return
         
-        self.entity.game_state.task_system.complete_task(self.current_task)
+        self._task_system.complete_task(self.current_task)
+        self._task_system.unregister_worker(self)
         self.current_task = None
         self._task_position = None
-        self._work_progress = 0
         self._is_building = False  # Make sure to reset building state
+        self._set_update_handler()
         
         # Reset any movement restrictions that might have been set
         if self._movement:
@@ -139,24 +187,36 @@ class TaskComponent(Component):
             return
 
         # Draw work progress indicator
-        zoom_level = self.entity.game_state.zoom_level
-        screen_x = (self.entity.position.x - camera_x) * zoom_level
-        screen_y = (self.entity.position.y - camera_y) * zoom_level
-        
-        progress = self._work_progress / self._work_time
-        width = 40 * zoom_level * progress
-        
-        # Progress bar background
-        pygame.draw.rect(surface, (100, 100, 100),
-                        (screen_x - 20 * zoom_level,
-                         screen_y - 30 * zoom_level,
-                         40 * zoom_level, 5 * zoom_level))
+        zoom_level = self._game_state.zoom_level
+        bar_width = self.BAR_WIDTH * zoom_level
+        bar_height = int(self.BAR_HEIGHT * zoom_level)
+        left = int((self.entity.position.x - camera_x) * zoom_level - bar_width * 0.5)
+        top = int((self.entity.position.y - camera_y) * zoom_level - self.BAR_OFFSET_Y * zoom_level)
+        bar_width = int(bar_width)
+        
+        # Nothing to draw if the bar is off-screen
+        if (left + bar_width < 0 or left > surface.get_width() or
+                top + bar_height < 0 or top > surface.get_height()):
+            return
         
-        # Progress bar fill
-        pygame.draw.rect(surface, (50, 200, 50),
-                        (screen_x - 20 * zoom_level,
-                         screen_y - 30 * zoom_level,
-                         width, 5 * zoom_level)) 
+        # Blit the pre-rendered bar for the current fill step
+        progress = self._wire_system.get_construction_progress(self._task_position)
+        step = min(int(progress * self.BAR_STEPS / self._work_time), self.BAR_STEPS)
+        surface.blit(self._get_bar(step, bar_width, bar_height), (left, top))
+
+    @classmethod
+    def _get_bar(cls, step: int, bar_width: int, bar_height: int) -> pygame.Surface:
+        """Get a progress bar surface, rendering it on first use"""
+        key = (step, bar_width, bar_height)
+        bar = cls._bar_cache.get(key)
+        if bar is None:
+            bar = pygame.Surface((max(bar_width, 1), max(bar_height, 1)))
+            bar.fill((100, 100, 100))
+            width = bar_width * step // cls.BAR_STEPS
+            if width >= 1:
+                bar.fill((50, 200, 50), (0, 0, width, bar_height))
+            cls._bar_cache[key] = bar
+        return bar
 
     def get_current_task(self):
         """Get the current task (compatibility method for debug UI)"""
@@ -180,4 +240,4 @@ class TaskComponent(Component):
     @property
     def required_progress(self) -> float:
         """Get required work time"""
-        return self.current_task.work_time if self.current_task else 2.0 
\ No newline at end of file
+        return self.current_task.work_time if self.current_task else 1.0 
\ No newline at end of file
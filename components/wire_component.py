@@ -1,17 +1,28 @@
 from components.base_component import Component
 from components.pathfinding_component import PathfindingComponent
+from components.movement_component import MovementComponent
+from components.task_component import TaskComponent
 from utils.config import TILE_SIZE
 import pygame
 
 class WireComponent(Component):
+    __slots__ = ('wire_task', '_electrical', '_pathfinding', '_movement', '_task')
+
     def __init__(self, entity):
         super().__init__(entity)
         self.wire_task = None  # (wire_pos, wire_type)
+        self._electrical = None  # Electrical component at the wire task's position
         self._pathfinding = None
+        self._movement = None
+        self._task = None
 
     def start(self) -> None:
-        """Get reference to pathfinding component when starting"""
+        """Get references to sibling components when starting"""
         self._pathfinding = self.entity.get_component(PathfindingComponent)
+        self._movement = self.entity.get_component(MovementComponent)
+        # Not every wire builder can hold tasks (aliens don't)
+        if self.entity.has_component(TaskComponent):
+            self._task = self.entity.get_component(TaskComponent)
 
     def set_wire_task(self, wire_pos, wire_type) -> bool:
         """Set a wire placement task and path to it"""
@@ -20,6 +31,7 @@ class WireComponent(Component):
 
         # Store the wire task
         self.wire_task = (wire_pos, wire_type)
+        self._electrical = self.entity.game_state.current_level.tilemap.get_electrical(wire_pos[0], wire_pos[1])
         
         # Use pathfinding to get to wire location
         result = self._pathfinding.set_target(wire_pos[0], wire_pos[1])
@@ -30,17 +42,23 @@ class WireComponent(Component):
         if not self.wire_task:
             return
 
-        wire_pos = self.wire_task[0]
-        electrical_comp = self.entity.game_state.current_level.tilemap.get_electrical(wire_pos[0], wire_pos[1])
+        # Resolve the component lazily if it wasn't placed yet when the task was set
+        electrical_comp = self._electrical
+        if electrical_comp is None:
+            wire_pos = self.wire_task[0]
+            electrical_comp = self.entity.game_state.current_level.tilemap.get_electrical(wire_pos[0], wire_pos[1])
+            self._electrical = electrical_comp
         
         # If task is complete, clear wire task
-        task_comp = self.entity.get_component('task')
+        task_comp = self._task
         if task_comp and not task_comp.current_task:
             if electrical_comp and electrical_comp.is_built:
                 self.wire_task = None
+                self._electrical = None
                 return
             
         # If pathfinding is complete and we're not moving
-        if not self._pathfinding.path and not self.entity.get_component('movement').moving:
+        if not self._pathfinding.path and not self._pathfinding.pending and not self._movement.moving:
             if not task_comp or not task_comp.current_task:
-                self.wire_task = None
\ No newline at end of file
+                self.wire_task = None
+                self._electrical = None
\ No newline at end of file
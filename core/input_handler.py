@@ -1,5 +1,5 @@
 import pygame
-from entities.enemies.base_enemy import BaseEnemy
+import numpy as np
 from utils.config import *
 
 
@@ -7,6 +7,17 @@ class InputHandler:
     def __init__(self, game_state):
         self.game_state = game_state
         
+        # Keyboard dispatch: key -> handler(event) returning True if handled
+        self._key_handlers = {
+            pygame.K_ESCAPE: self._on_escape,
+            pygame.K_TAB: self._on_tab,
+            pygame.K_F3: self._on_debug,
+            pygame.K_c: self._on_capture,
+            pygame.K_r: self._on_release,  # Release carried targets
+            pygame.K_b: self._on_build_menu,
+            pygame.K_m: self._on_mutation_menu,
+        }
+        
     def handle_game_input(self, event):
         if event.type == pygame.KEYDOWN:
             return self._handle_keyboard(event)
@@ -17,57 +28,66 @@ class InputHandler:
         return False
         
     def _handle_keyboard(self, event):
-        if event.key == pygame.K_ESCAPE:
-            self.game_state.game.change_state('pause')
-            return True
-        elif event.key == pygame.K_TAB:
-            new_level = 'abduction' if self.game_state.current_level == self.game_state.levels['ufo'] else 'ufo'
-            self.game_state.change_level(new_level)
-            return True
-        elif event.key == pygame.K_F3:
-            self.game_state.debug_ui.toggle()
-            return True
-        elif event.key == pygame.K_c:
-            # Get selected aliens
-            selected_aliens = [alien for alien in self.game_state.current_level.aliens if alien.selected]
-            
-            # Get nearest enemy to each selected alien
-            for alien in selected_aliens:
-                nearest_enemy = None
-                min_distance = float('inf')
-                
-                # Find nearest enemy within capture range
-                for entity in self.game_state.current_level.entity_manager.entities:
-                    if isinstance(entity, BaseEnemy):
-                        distance = (entity.position - alien.position).length()
-                        if distance <= alien.capture_range and distance < min_distance:
-                            min_distance = distance
-                            nearest_enemy = entity
-                
-                # Attempt capture if enemy found
-                if nearest_enemy and alien.capture:
-                    alien.capture.attempt_capture(nearest_enemy)
-            
-            return True
-        elif event.key == pygame.K_r:  # Add release key handler
-            # Get selected aliens
-            selected_aliens = [alien for alien in self.game_state.current_level.aliens if alien.selected]
-            
-            # Release any carried targets
-            for alien in selected_aliens:
-                if alien.capture and alien.capture.carrying_target:
-                    alien.capture.release_target()
-            
-            return True
-        elif event.key == pygame.K_b:
-            # Toggle build menu
-            if hasattr(self.game_state.ui.hud, 'build_ui'):
-                self.game_state.ui.hud.build_ui.toggle_build_menu()
-            return True
-        elif event.key == pygame.K_m:  # Add mutation menu toggle
-            self.game_state.ui.hud.mutation_menu.toggle()
+        handler = self._key_handlers.get(event.key)
+        return handler(event) if handler else False
+
+    def _on_escape(self, event):
+        self.game_state.game.change_state('pause')
+        return True
+
+    def _on_tab(self, event):
+        new_level = 'abduction' if self.game_state.current_level == self.game_state.levels['ufo'] else 'ufo'
+        self.game_state.change_level(new_level)
+        return True
+
+    def _on_debug(self, event):
+        self.game_state.debug_ui.toggle()
+        return True
+
+    def _on_capture(self, event):
+        # Get selected aliens
+        selected_aliens = [alien for alien in self.game_state.current_level.aliens if alien.selected]
+        
+        entity_manager = self.game_state.current_level.entity_manager
+        enemy_positions = entity_manager.get_enemy_positions()
+        if not selected_aliens or not len(enemy_positions):
             return True
-        return False
+        
+        # Squared distance from every selected alien to every enemy in one pass
+        alien_positions = np.array([(alien.position.x, alien.position.y) for alien in selected_aliens])
+        distances_sq = ((enemy_positions[None, :, :] - alien_positions[:, None, :]) ** 2).sum(axis=2)
+        
+        # Only enemies within each alien's capture range are candidates
+        capture_ranges = np.array([alien.capture_range for alien in selected_aliens])
+        distances_sq[distances_sq > (capture_ranges ** 2)[:, None]] = np.inf
+        nearest = distances_sq.argmin(axis=1)
+        
+        # Attempt capture with the nearest enemy found for each alien
+        for i, alien in enumerate(selected_aliens):
+            if np.isfinite(distances_sq[i, nearest[i]]) and alien.capture:
+                alien.capture.attempt_capture(entity_manager.enemies[nearest[i]])
+        
+        return True
+
+    def _on_release(self, event):
+        # Get selected aliens
+        selected_aliens = [alien for alien in self.game_state.current_level.aliens if alien.selected]
+        
+        # Release any carried targets
+        for alien in selected_aliens:
+            if alien.capture and alien.capture.carrying_target:
+                alien.capture.release_target()
+        
+        return True
+
+    def _on_build_menu(self, event):
+        if hasattr(self.game_state.ui.hud, 'build_ui'):
+            self.game_state.ui.hud.build_ui.toggle_build_menu()
+        return True
+
+    def _on_mutation_menu(self, event):
+        self.game_state.ui.hud.mutation_menu.toggle()
+        return True
 
     def _handle_mouse_click(self, event):
         # First check if mutation menu wants to handle the click
@@ -102,15 +122,20 @@ class InputHandler:
             
             # If in capture mode, try to mark targets
             if self.game_state.capture_system.capture_mode:
-                for entity in self.game_state.current_level.entity_manager.entities:
-                    if isinstance(entity, BaseEnemy):
-                        entity_rect = entity.get_rect()
-                        if entity_rect.collidepoint(world_x, world_y):
-                            self.game_state.capture_system.mark_target(entity)
-                            return True
+                # Only enemies hashed near the click can contain it
+                entity_manager = self.game_state.current_level.entity_manager
+                for entity in entity_manager.get_enemies_near(world_x, world_y, TILE_SIZE):
+                    entity_rect = entity.get_rect()
+                    if entity_rect.collidepoint(world_x, world_y):
+                        self.game_state.capture_system.mark_target(entity)
+                        return True
         return False
 
     def _handle_mouse_wheel(self, event):
+        # Horizontal-only scrolls don't zoom
+        if event.y == 0:
+            return False
+        
         # Get mouse position before zoom
         mouse_x, mouse_y = pygame.mouse.get_pos()
         
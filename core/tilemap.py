@@ -1,12 +1,41 @@
+import math
 import pygame
+import numpy as np
 from utils.config import *
-from .tiles import TILES, TILE_FLOOR, Tile
+from utils.types import pack_tile, unpack_tile
+from .tiles import TILE_FLOOR, TILE_LIST, TILE_INDEX, Tile
+
+CHUNK_SHIFT = 4  # Terrain is cached in chunks of 2**4 tiles per side
+CHUNK_TILES = 1 << CHUNK_SHIFT
+
+# Walkability and color per tile index, for building the combined walkable
+# grid and rasterizing chunks. Colors are RGBX bytes viewed as one uint32.
+_TILE_WALKABLE = np.array([tile.walkable for tile in TILE_LIST], dtype=bool)
+_TILE_COLORS = np.array([(*tile.color, 0) for tile in TILE_LIST], dtype=np.uint8).view(np.uint32).ravel()
+
+# Packed like _TILE_COLORS, as RGBX bytes
+_GRID_LINE_COLOR = np.array([50, 50, 50, 0], dtype=np.uint8).view(np.uint32)[0]
+
+def _pixel_tiles(count, pixels, tile_size):
+    """
+    Map each pixel along one axis of a chunk to the tile drawn there and the
+    pixel's offset within that tile. Tiles start at int(i * tile_size) and later
+    tiles overlap the rounded-up edge of earlier ones, as when blitting in order.
+    """
+    starts = (np.arange(count) * tile_size).astype(int)
+    positions = np.arange(pixels)
+    tiles = np.searchsorted(starts, positions, side='right') - 1
+    return tiles, positions - starts[tiles]
 
 class TileMap:
     """
     Manages a 2D grid-based map containing both terrain tiles and electrical components.
     Handles rendering, tile manipulation, and electrical component placement.
     """
+    __slots__ = ('width', 'height', 'game_state', 'tile_layer', 'has_electrical',
+                 'electrical_components', 'collision_layer',
+                 'walkable', '_chunk_cache', '_chunk_zoom')
+    
     def __init__(self, width, height, game_state):
         """
         Initialize a new tile map with specified dimensions.
@@ -20,45 +49,73 @@ class TileMap:
         self.height = height
         self.game_state = game_state
         
-        # Main ground layer
-        self.tiles = [[TILE_FLOOR for _ in range(width)] for _ in range(height)]
+        # Main ground layer, as indices into TILE_LIST
+        self.tile_layer = np.full((height, width), TILE_INDEX[TILE_FLOOR.name], dtype=np.uint8)
         
-        # Electrical layer
-        self.electrical_layer = [[None for _ in range(width)] for _ in range(height)]
-        self.electrical_components = {}  # (x,y) -> ElectricalComponent
+        # Electrical layer: which tiles hold a component, as a dense mask
+        self.has_electrical = np.zeros((height, width), dtype=bool)
+        # Keyed by pack_tile(x, y) ints, which hash faster than tuples
+        self.electrical_components = {}  # packed (x, y) -> ElectricalComponent
         
         # Add collision layer
-        self.collision_layer = [[True for _ in range(width)] for _ in range(height)]
+        self.collision_layer = np.ones((height, width), dtype=bool)
+        
+        # Tile walkability combined with the collision layer, kept in sync by
+        # set_tile/set_walkable so is_walkable is a single lookup
+        self.walkable = self.collision_layer & _TILE_WALKABLE[self.tile_layer]
+        
+        # Rendered terrain chunks at the current zoom: (chunk_x, chunk_y) -> Surface
+        self._chunk_cache = {}
+        self._chunk_zoom = None
     
     def set_tile(self, x, y, tile_name: str):
         """Set a tile using its name"""
         if 0 <= x < self.width and 0 <= y < self.height:
-            self.tiles[y][x] = TILES[tile_name]
+            index = TILE_INDEX[tile_name]
+            self.tile_layer[y, x] = index
+            self.walkable[y, x] = _TILE_WALKABLE[index] and self.collision_layer[y, x]
+            # Redraw the chunk holding this tile next frame
+            self._chunk_cache.pop((x >> CHUNK_SHIFT, y >> CHUNK_SHIFT), None)
             
     def get_tile(self, x, y) -> Tile:
         """Get the tile object at the given position"""
         if 0 <= x < self.width and 0 <= y < self.height:
-            return self.tiles[y][x]
+            return TILE_LIST[self.tile_layer[y, x]]
         return None
         
     def set_walkable(self, x: int, y: int, walkable: bool):
         """Set whether a tile can be walked on"""
         if 0 <= x < self.width and 0 <= y < self.height:
-            self.collision_layer[y][x] = walkable
+            self.collision_layer[y, x] = walkable
+            self.walkable[y, x] = walkable and _TILE_WALKABLE[self.tile_layer[y, x]]
             
     def is_walkable(self, x: int, y: int) -> bool:
         """Check if a tile can be walked on"""
         if not (0 <= x < self.width and 0 <= y < self.height):
             return False
-        # Check both the tile's inherent walkability and the collision layer
-        tile = self.get_tile(x, y)
-        return tile and tile.walkable and self.collision_layer[y][x]
+        # Covers both the tile's inherent walkability and the collision layer
+        return self.walkable.item(y, x)
+        
+    def is_walkable_unchecked(self, x: int, y: int) -> bool:
+        """Like is_walkable, for callers that have already bounds-checked x and y"""
+        return self.walkable.item(y, x)
+        
+    def walkable_mask(self, xs, ys) -> np.ndarray:
+        """
+        Vectorized is_walkable: check arrays of tile coordinates in one call.
+        xs and ys are broadcast together; out-of-bounds tiles aren't walkable.
+        """
+        xs, ys = np.broadcast_arrays(xs, ys)
+        inside = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        mask = np.zeros(xs.shape, dtype=bool)
+        mask[inside] = self.walkable[ys[inside], xs[inside]]
+        return mask
         
     def set_electrical(self, x, y, component):
         """
         Store an electrical component at the given position.
         Uses dual storage for efficient access: a dictionary for quick lookups
-        and a 2D array for spatial relationships.
+        and a 2D mask for spatial relationships.
         
         Args:
             x, y (int): Grid coordinates
@@ -73,22 +130,19 @@ class TileMap:
             return False
         
         # Store in both data structures
-        key = (x, y)
-        self.electrical_components[key] = component
-        self.electrical_layer[y][x] = component
-        
-        # Verify storage
-        stored = self.electrical_components.get(key)
+        self._store_electrical(x, y, component)
         return True
 
     def get_electrical(self, x, y):
         """Get electrical component at position"""
         if 0 <= x < self.width and 0 <= y < self.height:
-            key = (x, y)
-            comp = self.electrical_components.get(key)
-            return comp
+            return self.electrical_components.get(pack_tile(x, y))
         return None
 
+    def get_electrical_positions(self) -> list[tuple[int, int]]:
+        """Get the (x, y) tile positions of all electrical components"""
+        return [unpack_tile(key) for key in self.electrical_components]
+
     def render(self, surface, camera_x, camera_y):
         """
         Render the visible portion of the map using a camera-based viewport system.
@@ -101,79 +155,92 @@ class TileMap:
         zoom_level = self.game_state.zoom_level
         
         # Calculate visible area
-        start_x = max(0, int(camera_x // TILE_SIZE))
-        start_y = max(0, int(camera_y // TILE_SIZE))
-        end_x = min(self.width, int((camera_x + WINDOW_WIDTH / zoom_level) // TILE_SIZE) + 3)
-        end_y = min(self.height, int((camera_y + WINDOW_HEIGHT / zoom_level) // TILE_SIZE) + 3)
-        
-        # First render terrain tiles
-        for y in range(start_y, end_y):
-            for x in range(start_x, end_x):
-                tile = self.tiles[y][x]
-                
-                # Calculate screen position with zoom
-                screen_x = (x * TILE_SIZE - camera_x) * zoom_level
-                screen_y = (y * TILE_SIZE - camera_y) * zoom_level
-                
-                # Draw tile scaled by zoom
-                pygame.draw.rect(surface, tile.color, 
-                               (screen_x, screen_y, 
-                                TILE_SIZE * zoom_level, TILE_SIZE * zoom_level))
-                # Add grid lines
-                pygame.draw.rect(surface, (50, 50, 50), 
-                               (screen_x, screen_y, 
-                                TILE_SIZE * zoom_level, TILE_SIZE * zoom_level), 
-                               max(1, int(zoom_level)))
+        start_x, start_y, end_x, end_y = self._visible_bounds(camera_x, camera_y, zoom_level)
+        
+        # First render terrain from cached chunks, one blit per visible chunk
+        if zoom_level != self._chunk_zoom:
+            self._chunk_cache.clear()
+            self._chunk_zoom = zoom_level
+        chunk_pixels = CHUNK_TILES * TILE_SIZE * zoom_level
+        origin_x = camera_x * zoom_level
+        origin_y = camera_y * zoom_level
+        # Floor the chunk origins: blitting a float position truncates it, so a
+        # tile at a non-negative screen position lands on the floor of it, as
+        # sprites do; truncating a negative chunk origin would shift it by 1px
+        floor = math.floor
+        chunk_columns = [(chunk_x, floor(chunk_x * chunk_pixels - origin_x))
+                         for chunk_x in range(start_x >> CHUNK_SHIFT, ((end_x - 1) >> CHUNK_SHIFT) + 1)]
+        get_chunk = self._get_chunk
+        draws = []
+        visible_chunks = {}
+        for chunk_y in range(start_y >> CHUNK_SHIFT, ((end_y - 1) >> CHUNK_SHIFT) + 1):
+            screen_y = floor(chunk_y * chunk_pixels - origin_y)
+            for chunk_x, screen_x in chunk_columns:
+                chunk = get_chunk(chunk_x, chunk_y, zoom_level)
+                visible_chunks[(chunk_x, chunk_y)] = chunk
+                draws.append((chunk, (screen_x, screen_y)))
+        surface.blits(draws, doreturn=False)
+        
+        # Only keep chunks that are on screen, so memory stays bounded by the view
+        self._chunk_cache = visible_chunks
 
-        # Then render electrical components
-        for y in range(start_y, end_y):
-            for x in range(start_x, end_x):
-                if (x, y) in self.electrical_components:
-                    self.render_electrical(surface, x, y, camera_x, camera_y, zoom_level)
+        # Then render electrical components, finding the visible ones from the
+        # mask (np.nonzero yields them in row-major order)
+        render_electrical = self.render_electrical
+        ys, xs = np.nonzero(self.has_electrical[start_y:end_y, start_x:end_x])
+        for y, x in zip((ys + start_y).tolist(), (xs + start_x).tolist()):
+            render_electrical(surface, x, y, camera_x, camera_y, zoom_level)
 
-    def _render_electrical_layer(self, surface, camera_x, camera_y):
-        zoom_level = self.game_state.zoom_level
-        
-        # Calculate visible area
-        start_x = max(0, int(camera_x // TILE_SIZE))
-        start_y = max(0, int(camera_y // TILE_SIZE))
-        end_x = min(self.width, int((camera_x + WINDOW_WIDTH / zoom_level) // TILE_SIZE) + 1)
-        end_y = min(self.height, int((camera_y + WINDOW_HEIGHT / zoom_level) // TILE_SIZE) + 1)
-        
-        # Render visible electrical components
-        for y in range(start_y, end_y):
-            for x in range(start_x, end_x):
-                if (x, y) in self.electrical_components:
-                    screen_x = (x * TILE_SIZE - camera_x) * zoom_level
-                    screen_y = (y * TILE_SIZE - camera_y) * zoom_level
-                    tile_size = TILE_SIZE * zoom_level
-                    
-                    # Draw wire pattern
-                    wire_color = (255, 255, 0)
-                    wire_width = max(2 * zoom_level, 1)
-                    
-                    # Draw main wire line
-                    pygame.draw.line(surface, wire_color,
-                                   (screen_x + tile_size * 0.2, screen_y + tile_size * 0.5),
-                                   (screen_x + tile_size * 0.8, screen_y + tile_size * 0.5),
-                                   int(wire_width))
-                    
-                    # Draw connection nodes
-                    node_radius = max(3 * zoom_level, 2)
-                    pygame.draw.circle(surface, wire_color,
-                                     (int(screen_x + tile_size * 0.2), int(screen_y + tile_size * 0.5)),
-                                     int(node_radius))
-                    pygame.draw.circle(surface, wire_color,
-                                     (int(screen_x + tile_size * 0.8), int(screen_y + tile_size * 0.5)),
-                                     int(node_radius))
+    def _get_chunk(self, chunk_x, chunk_y, zoom_level):
+        """Get the rendered terrain for a chunk, drawing it on first use"""
+        chunk = self._chunk_cache.get((chunk_x, chunk_y))
+        if chunk is None:
+            tile_size = TILE_SIZE * zoom_level
+            left = chunk_x * CHUNK_TILES
+            top = chunk_y * CHUNK_TILES
+            tiles = self.tile_layer[top:top + CHUNK_TILES, left:left + CHUNK_TILES]
+            rows, columns = tiles.shape
+            width = math.ceil(columns * tile_size)
+            height = math.ceil(rows * tile_size)
+            
+            # Rasterize the whole chunk at once from packed RGBX colors: widen
+            # each tile row to pixel columns, then copy those out to pixel rows
+            size = math.ceil(tile_size)
+            tile_x, local_x = _pixel_tiles(columns, width, tile_size)
+            tile_y, local_y = _pixel_tiles(rows, height, tile_size)
+            tile_rows = _TILE_COLORS[tiles].take(tile_x, axis=1)
+            if zoom_level >= GRID_VISIBLE_ZOOM:
+                border = max(1, int(zoom_level))
+                tile_rows[:, (local_x < border) | (local_x >= size - border)] = _GRID_LINE_COLOR
+            pixels = tile_rows.take(tile_y, axis=0)
+            if zoom_level >= GRID_VISIBLE_ZOOM:
+                pixels[(local_y < border) | (local_y >= size - border)] = _GRID_LINE_COLOR
+            
+            # Rounding can leave the last pixel row or column past every tile
+            pixels[local_y >= size] = 0
+            pixels[:, local_x >= size] = 0
+            
+            # Match the display's pixel format so blits skip conversion
+            chunk = pygame.image.frombuffer(pixels, (width, height), 'RGBX').convert()
+            self._chunk_cache[(chunk_x, chunk_y)] = chunk
+        return chunk
+
+    def _visible_bounds(self, camera_x, camera_y, zoom_level):
+        """Get the (start_x, start_y, end_x, end_y) tile range on screen, plus a margin"""
+        view_scale = 1.0 / zoom_level
+        start_x = int(camera_x) >> TILE_SIZE_LOG2
+        start_y = int(camera_y) >> TILE_SIZE_LOG2
+        end_x = (int(camera_x + WINDOW_WIDTH * view_scale) >> TILE_SIZE_LOG2) + 3
+        end_y = (int(camera_y + WINDOW_HEIGHT * view_scale) >> TILE_SIZE_LOG2) + 3
+        return (max(0, start_x), max(0, start_y),
+                min(self.width, end_x), min(self.height, end_y))
 
     def render_electrical(self, surface, tile_x, tile_y, camera_x, camera_y, zoom_level):
         """Render electrical component at the specified tile position"""
-        pos = (tile_x, tile_y)
-        component = self.electrical_components.get(pos)
+        component = self.electrical_components.get(pack_tile(tile_x, tile_y))
         
         # Only render if this is the primary tile or component doesn't have a primary tile
-        if component and (not hasattr(component, 'primary_tile') or component.primary_tile == pos):
+        if component and getattr(component, 'primary_tile', (tile_x, tile_y)) == (tile_x, tile_y):
             screen_x = (tile_x * TILE_SIZE - camera_x) * zoom_level
             screen_y = (tile_y * TILE_SIZE - camera_y) * zoom_level
             
@@ -190,8 +257,11 @@ class TileMap:
             return False
             
         # Store in both data structures
-        key = (x, y)
-        self.electrical_components[key] = component
-        self.electrical_layer[y][x] = component
+        self._store_electrical(x, y, component)
         
-        return True
\ No newline at end of file
+        return True
+
+    def _store_electrical(self, x, y, component):
+        """Store a component at an in-bounds position"""
+        self.electrical_components[pack_tile(x, y)] = component
+        self.has_electrical[y, x] = True
\ No newline at end of file
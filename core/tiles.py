@@ -1,7 +1,7 @@
-from dataclasses import dataclass, field
-from typing import Tuple, List
+from dataclasses import dataclass
+from typing import Tuple, List, Optional
 
-@dataclass
+@dataclass(slots=True)
 class ElectricalComponent:
     """
     Represents an electrical component in the power grid system.
@@ -9,34 +9,14 @@ class ElectricalComponent:
     power handling characteristics and connection states.
     """
     type: str  # 'wire', 'source', 'consumer'
-    _under_construction: bool = True  # Use private field for property
-    _is_built: bool = False  # Use private field for property
+    under_construction: bool = True
+    is_built: bool = False
     capacity: float = 0.0
     current_power: float = 0.0
-    connected_tiles: List[Tuple[int, int]] = field(default_factory=list)
-    
-    def __post_init__(self):
-        """Initialize after dataclass fields are set"""
-    
-    @property
-    def under_construction(self):
-        return self._under_construction
-        
-    @under_construction.setter
-    def under_construction(self, value):
-        self._under_construction = value
-        
-    @property
-    def is_built(self):
-        return self._is_built
-        
-    @is_built.setter
-    def is_built(self, value):
-        self._is_built = value
-        (f"[DEBUG] ElectricalComponent is_built set to {value}")
-    
+    connected_tiles: Optional[List[Tuple[int, int]]] = None  # Created on first connection
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Tile:
     """
     Represents a basic terrain tile with properties that affect gameplay mechanics.
@@ -150,4 +130,8 @@ TILES = {
 }
 
 # Dictionary for ID lookup
-TILES_BY_ID = {tile.id: tile for tile in TILES.values()} 
\ No newline at end of file
+TILES_BY_ID = {tile.id: tile for tile in TILES.values()}
+
+# Compact per-map tile indices (Tile.id isn't unique, so maps store these instead)
+TILE_LIST = list(TILES.values())
+TILE_INDEX = {name: i for i, name in enumerate(TILES)} 
\ No newline at end of file
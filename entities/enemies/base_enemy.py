@@ -188,7 +188,7 @@ class BaseEnemy(Entity, ABC):
         elif self.capture_state == CaptureState.BEING_CARRIED:
             # Update position to follow carrier
             if self.carrier:
-                self.position = self.carrier.position
+                self.position = self.carrier.position.copy()
                 # Chance to break free
                 if random.random() < self.struggle_chance * dt:
                     self.capture_state = CaptureState.NONE
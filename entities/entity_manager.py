@@ -1,4 +1,8 @@
+import numpy as np
 from utils.config import TILE_SIZE
+from entities.enemies.base_enemy import BaseEnemy
+
+ENEMY_GRID_SIZE = 64  # Pixel size of the enemy spatial hash buckets
 
 
 class EntityManager:
@@ -10,6 +14,15 @@ class EntityManager:
         self.game_state = game_state
         self.entities = []  # List of all active entities
         self.items = []     # List of all items in the world
+        self.enemies = []   # The BaseEnemy subset of entities
+        
+        # Spatial hash of enemies by bucket, rebuilt at most once per frame
+        self._enemy_grid = {}  # (bucket_x, bucket_y) -> [BaseEnemy]
+        self._enemy_grid_frame = -1
+        
+        # Enemy positions as an (N, 2) array aligned with enemies, synced once per frame
+        self._enemy_positions = np.zeros((0, 2))
+        self._enemy_positions_frame = -1
         
     def add_entity(self, entity):
         """
@@ -21,6 +34,9 @@ class EntityManager:
         """
         entity.game_state = self.game_state
         self.entities.append(entity)
+        if isinstance(entity, BaseEnemy):
+            self.enemies.append(entity)
+            self._enemy_positions_frame = -1  # Keep rows aligned with enemies
         
     def add_item(self, item):
         """
@@ -77,6 +93,54 @@ class EntityManager:
     def clear(self):
         self.entities.clear()
         self.items.clear()
+        self.enemies.clear()
+        self._enemy_grid.clear()
+        self._enemy_grid_frame = -1
+        self._enemy_positions_frame = -1
+        
+    def get_enemies_near(self, x: float, y: float, radius: float) -> list:
+        """
+        Get enemies in the spatial hash buckets overlapping a square around a point.
+        Candidates may lie outside the radius; callers do the exact test.
+        
+        Args:
+            x, y (float): World position in pixels
+            radius (float): Half-size of the square to query, in pixels
+            
+        Returns:
+            list: Candidate enemies
+        """
+        if self._enemy_grid_frame != self.game_state.frame:
+            self._rebuild_enemy_grid()
+        
+        enemies = []
+        grid = self._enemy_grid
+        for bucket_y in range(int((y - radius) // ENEMY_GRID_SIZE), int((y + radius) // ENEMY_GRID_SIZE) + 1):
+            for bucket_x in range(int((x - radius) // ENEMY_GRID_SIZE), int((x + radius) // ENEMY_GRID_SIZE) + 1):
+                bucket = grid.get((bucket_x, bucket_y))
+                if bucket:
+                    enemies.extend(bucket)
+        return enemies
+        
+    def get_enemy_positions(self) -> np.ndarray:
+        """
+        Get enemy positions as an (N, 2) array, row i matching enemies[i].
+        Synced from the entities at most once per frame.
+        """
+        if self._enemy_positions_frame != self.game_state.frame:
+            self._enemy_positions = np.array([(enemy.position.x, enemy.position.y) for enemy in self.enemies],
+                                             dtype=float).reshape(-1, 2)
+            self._enemy_positions_frame = self.game_state.frame
+        return self._enemy_positions
+        
+    def _rebuild_enemy_grid(self):
+        """Bucket every enemy by its current position"""
+        grid = {}
+        for enemy in self.enemies:
+            bucket = (int(enemy.position.x // ENEMY_GRID_SIZE), int(enemy.position.y // ENEMY_GRID_SIZE))
+            grid.setdefault(bucket, []).append(enemy)
+        self._enemy_grid = grid
+        self._enemy_grid_frame = self.game_state.frame
         
     def is_tile_occupied(self, position: tuple, ignore_entity=None) -> bool:
         """
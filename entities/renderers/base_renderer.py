@@ -21,6 +21,20 @@ class BaseRenderer(ABC):
 class BaseElectricalRenderer(BaseRenderer):
     """Base class specifically for electrical component renderers"""
     
+    def __init__(self):
+        # One transparent surface reused by every component drawn per frame
+        self._scratch_surface = None
+        self._scratch_size = None
+    
+    def get_scratch_surface(self, size):
+        """Get a cleared size x size transparent surface to draw a component on"""
+        if size != self._scratch_size:
+            self._scratch_surface = pygame.Surface((size, size), pygame.SRCALPHA)
+            self._scratch_size = size
+        else:
+            self._scratch_surface.fill((0, 0, 0, 0))
+        return self._scratch_surface
+    
     def draw_construction_progress(self, surface, size, progress, zoom_level):
         """Shared method for drawing construction progress"""
         height = size * progress
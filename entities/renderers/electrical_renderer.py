@@ -3,9 +3,11 @@ from .renderer_registry import RendererRegistry
 class ElectricalRendererSystem:
     def __init__(self):
         self.registry = RendererRegistry()
+        # The registry's own dict, so later register_renderer calls show up here
+        self._renderers = self.registry.renderers
     
     def render(self, component, surface, screen_x, screen_y, zoom_level):
         """Render an electrical component using its appropriate renderer"""
-        renderer = self.registry.get_renderer(component.type)
+        renderer = self._renderers.get(component.type)
         if renderer:
             renderer.render(component, surface, screen_x, screen_y, zoom_level) 
\ No newline at end of file
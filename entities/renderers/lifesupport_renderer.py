@@ -8,8 +8,13 @@ class LifeSupportRenderer(BaseElectricalRenderer):
         tile_size = TILE_SIZE * zoom_level
         size = tile_size * 2  # 2x2 tiles
         
-        # Create surface with transparency
-        life_support_surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        # Reuse one transparent surface across frames
+        life_support_surface = self.get_scratch_surface(size)
+        
+        # Bound once, since this redraws every frame for the particle animation
+        draw_rect = pygame.draw.rect
+        draw_circle = pygame.draw.circle
+        draw_line = pygame.draw.line
         
         if component.under_construction:
             # Draw construction progress
@@ -17,15 +22,15 @@ class LifeSupportRenderer(BaseElectricalRenderer):
             height = size * progress
             
             # Base structure (gray)
-            pygame.draw.rect(life_support_surface, (128, 128, 128, 180),
-                           (0, size - height, size, height))
+            draw_rect(life_support_surface, (128, 128, 128, 180),
+                      (0, size - height, size, height))
             
             # Construction scaffolding
             scaffold_color = (200, 200, 200, 100)
             for i in range(4):
                 x = size * (i / 3)
-                pygame.draw.line(life_support_surface, scaffold_color,
-                               (x, size), (x, 0), max(1, int(2 * zoom_level)))
+                draw_line(life_support_surface, scaffold_color,
+                          (x, size), (x, 0), max(1, int(2 * zoom_level)))
         else:
             # Main body
             margin = size * 0.1
@@ -34,7 +39,7 @@ class LifeSupportRenderer(BaseElectricalRenderer):
                 body_color = (100, 150, 255, 255)  # Blue when active
             else:
                 body_color = (80, 100, 150, 255)  # Darker blue when inactive
-            pygame.draw.rect(life_support_surface, body_color, body_rect)
+            draw_rect(life_support_surface, body_color, body_rect)
             
             # Draw ventilation grills
             grill_color = (192, 192, 192, 255)
@@ -42,8 +47,8 @@ class LifeSupportRenderer(BaseElectricalRenderer):
             grill_height = size * 0.1
             for i in range(3):
                 y_pos = size * 0.3 + (i * grill_spacing)
-                pygame.draw.rect(life_support_surface, grill_color,
-                               (margin * 2, y_pos, size - 4*margin, grill_height))
+                draw_rect(life_support_surface, grill_color,
+                          (margin * 2, y_pos, size - 4*margin, grill_height))
             
             # Draw oxygen particles when active
             if component.is_active:
@@ -55,13 +60,13 @@ class LifeSupportRenderer(BaseElectricalRenderer):
                     particle_x = size * (0.3 + 0.4 * (i/5))
                     particle_y = size * (0.2 + offset * 0.6)
                     particle_size = max(2, int(4 * zoom_level))
-                    pygame.draw.circle(life_support_surface, particle_color,
-                                    (particle_x, particle_y), particle_size)
+                    draw_circle(life_support_surface, particle_color,
+                                (particle_x, particle_y), particle_size)
             
             # Status indicator light
             status_color = (0, 255, 0, 200) if component.is_active else (255, 0, 0, 200)
-            pygame.draw.circle(life_support_surface, status_color,
-                             (size - margin*2, margin*2), max(3, int(5 * zoom_level)))
+            draw_circle(life_support_surface, status_color,
+                        (size - margin*2, margin*2), max(3, int(5 * zoom_level)))
         
         # Debug visualization
         if hasattr(component, 'connected_tiles') and component.connected_tiles:
@@ -70,13 +75,13 @@ class LifeSupportRenderer(BaseElectricalRenderer):
             for tile_pos in component.connected_tiles:
                 rel_x = (tile_pos[0] - component.primary_tile[0]) * tile_size
                 rel_y = (tile_pos[1] - component.primary_tile[1]) * tile_size
-                pygame.draw.circle(life_support_surface, debug_color,
-                                 (rel_x, rel_y), 5)
+                draw_circle(life_support_surface, debug_color,
+                            (rel_x, rel_y), 5)
         
         # Power state indicator (top-right corner)
         power_color = (0, 255, 0, 255) if component.is_powered else (255, 0, 0, 255)
-        pygame.draw.circle(life_support_surface, power_color,
-                          (size - 10, 10), 5)
+        draw_circle(life_support_surface, power_color,
+                    (size - 10, 10), 5)
         
         # Blit to main surface
         surface.blit(life_support_surface, (screen_x, screen_y))
@@ -1,10 +1,63 @@
+import math
 import pygame
 from utils.config import TILE_SIZE
 from .base_renderer import BaseElectricalRenderer
 
+_draw_line = pygame.draw.line
+_draw_circle = pygame.draw.circle
+
 class WireRenderer(BaseElectricalRenderer):
+    def __init__(self):
+        super().__init__()
+        # Per-zoom geometry and pre-drawn wires shared by every wire, see _set_zoom
+        self._zoom_level = None
+        self._tile_size = None
+        self._padding = 0
+        self._sprites = {}  # wire color -> Surface at the current zoom
+    
+    def _set_zoom(self, zoom_level):
+        """Reset the cached wires for a new zoom level"""
+        self._zoom_level = zoom_level
+        self._tile_size = TILE_SIZE * zoom_level
+        # Nodes can poke past the tile edge at low zoom
+        self._padding = int(max(3 * zoom_level, 2))
+        self._sprites.clear()
+    
+    def _get_sprite(self, wire_color):
+        """Get the wire drawn in a color at the current zoom, drawing it on first use"""
+        sprite = self._sprites.get(wire_color)
+        if sprite is None:
+            zoom_level = self._zoom_level
+            tile_size = self._tile_size
+            padding = self._padding
+            sprite = pygame.Surface((math.ceil(tile_size) + 2 * padding,) * 2, pygame.SRCALPHA)
+            
+            # Node and line positions, offset by the padding
+            left = padding + tile_size * 0.2
+            right = padding + tile_size * 0.8
+            middle = padding + tile_size * 0.5
+            
+            # Draw main wire line
+            _draw_line(sprite, wire_color, (left, middle), (right, middle),
+                       int(max(2 * zoom_level, 1)))
+            
+            # Draw connection nodes
+            node_radius = int(max(3 * zoom_level, 2))
+            node_y = int(middle)
+            _draw_circle(sprite, wire_color, (int(left), node_y), node_radius)
+            _draw_circle(sprite, wire_color, (int(right), node_y), node_radius)
+            self._sprites[wire_color] = sprite
+        return sprite
+    
     def render(self, component, surface, screen_x, screen_y, zoom_level):
-        tile_size = TILE_SIZE * zoom_level
+        if zoom_level != self._zoom_level:
+            self._set_zoom(zoom_level)
+        tile_size = self._tile_size
+        
+        # Skip wires that are fully off-screen (the tilemap renders a margin)
+        if (screen_x + tile_size < 0 or screen_x > surface.get_width() or
+                screen_y + tile_size < 0 or screen_y > surface.get_height()):
+            return
         
         # Choose color based on construction state
         if component.is_built:
@@ -14,17 +67,5 @@ class WireRenderer(BaseElectricalRenderer):
         else:
             wire_color = (128, 128, 128)  # Gray for not started
         
-        # Draw main wire line
-        pygame.draw.line(surface, wire_color,
-                        (screen_x + tile_size * 0.2, screen_y + tile_size * 0.5),
-                        (screen_x + tile_size * 0.8, screen_y + tile_size * 0.5),
-                        int(max(2 * zoom_level, 1)))
-        
-        # Draw connection nodes
-        node_radius = max(3 * zoom_level, 2)
-        pygame.draw.circle(surface, wire_color,
-                         (int(screen_x + tile_size * 0.2), int(screen_y + tile_size * 0.5)),
-                         int(node_radius))
-        pygame.draw.circle(surface, wire_color,
-                         (int(screen_x + tile_size * 0.8), int(screen_y + tile_size * 0.5)),
-                         int(node_radius)) 
\ No newline at end of file
+        padding = self._padding
+        surface.blit(self._get_sprite(wire_color), (int(screen_x) - padding, int(screen_y) - padding))
@@ -54,6 +54,7 @@ class BaseLevel(ABC):
                 item.render_with_offset(screen, camera_x, camera_y)
         
         # Render entities with capture indicators (top layer)
+        zoom_level = self.game_state.zoom_level
         for entity in self.entity_manager.entities:
             if not entity.active:
                 continue
@@ -62,9 +63,9 @@ class BaseLevel(ABC):
             
             # Draw capture range indicator for selected aliens
             if isinstance(entity, Alien) and entity.selected:
-                screen_x = (entity.position.x - camera_x) * self.game_state.zoom_level
-                screen_y = (entity.position.y - camera_y) * self.game_state.zoom_level
-                capture_radius = entity.capture_range * self.game_state.zoom_level
+                screen_x = (entity.position.x - camera_x) * zoom_level
+                screen_y = (entity.position.y - camera_y) * zoom_level
+                capture_radius = entity.capture_range * zoom_level
                 
                 pygame.draw.circle(screen, (255, 255, 0, 64),
                                  (int(screen_x), int(screen_y)),
@@ -1,3 +1,4 @@
+import logging
 import pygame
 
 from entities.alien import Alien
@@ -25,6 +26,8 @@ from systems.power_system import PowerSystem
 from systems.oxygen_system import OxygenSystem
 from systems.mutation_system import MutationSystem
 
+log = logging.getLogger(__name__)
+
 class GameState(State):
     """
     Main gameplay state handling level management, systems coordination,
@@ -74,6 +77,7 @@ class GameState(State):
         # Initialize the entity manager
         self.entity_manager = EntityManager(self)
         self.current_time = 0
+        self.frame = 0  # Incremented every update; used for per-frame caches
         self.wire_mode = False
         
         # Add build UI
@@ -117,10 +121,14 @@ class GameState(State):
 
     def update(self, dt):
         """Update game state including level, camera, and systems."""
+        self.frame += 1
+        
         if self.current_level:
             # Update core systems
             self.capture_system.update(dt)
+            self.task_system.batch_update()
             self.current_level.update(dt)
+            self.wire_system.tick(dt)
             
             # Update camera position to follow selected alien
             followed_alien = next((alien for alien in self.current_level.aliens if alien.selected), 
@@ -168,8 +176,6 @@ class GameState(State):
         
         # Render build system preview
         self.build_system.draw(screen)
-        
-        pygame.display.flip()
 
     def save_game_state(self, slot=None):
         save_data = {
@@ -180,7 +186,7 @@ class GameState(State):
             # ... rest of save data ...
         }
         filepath = save_game(save_data, slot)
-        print(f"Game saved to: {filepath}")
+        log.info("Game saved to: %s", filepath)
     
     def load_game_state(self, filepath):
         save_data = load_game(filepath)
@@ -219,6 +225,9 @@ class GameState(State):
             if self.current_level:
                 self.entity_manager.clear()
             
+            # Wire slots are keyed by position only, so they can't carry over
+            self.wire_system.clear_construction()
+            
             # Set and initialize the new level
             self.current_level = self.levels[level_name]
             self.current_level.initialize()
@@ -227,4 +236,4 @@ class GameState(State):
             self.camera_system.position = pygame.math.Vector2(0, 0)
             self.camera_system.zoom_level = 1.0
         else:
-            print(f"Warning: Level '{level_name}' not found") 
\ No newline at end of file
+            log.warning("Level '%s' not found", level_name) 
\ No newline at end of file
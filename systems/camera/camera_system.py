@@ -35,11 +35,17 @@ class CameraSystem:
 
     def handle_zoom(self, zoom_delta, mouse_pos):
         old_zoom = self.zoom_level
-        self.zoom_level = max(self.min_zoom, 
-                            min(self.max_zoom, 
-                                self.zoom_level + zoom_delta * self.zoom_speed))
+        new_zoom = old_zoom + zoom_delta * self.zoom_speed
+        if new_zoom < self.min_zoom:
+            new_zoom = self.min_zoom
+        elif new_zoom > self.max_zoom:
+            new_zoom = self.max_zoom
         
-        if old_zoom != self.zoom_level:
-            zoom_factor = self.zoom_level / old_zoom
-            self.position.x += (mouse_pos[0] / old_zoom) * (1 - zoom_factor)
-            self.position.y += (mouse_pos[1] / old_zoom) * (1 - zoom_factor)
\ No newline at end of file
+        # Already at a zoom bound, so the camera stays put
+        if new_zoom == old_zoom:
+            return
+        
+        self.zoom_level = new_zoom
+        zoom_factor = new_zoom / old_zoom
+        self.position.x += (mouse_pos[0] / old_zoom) * (1 - zoom_factor)
+        self.position.y += (mouse_pos[1] / old_zoom) * (1 - zoom_factor)
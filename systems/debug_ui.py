@@ -49,7 +49,7 @@ class DebugUI:
         # Game State Information
         debug_info.append("=== Game State ===")
         debug_info.append(f"Wire Mode: {self.game_state.wire_mode}")
-        debug_info.append(f"Electrical Components: {list(self.game_state.current_level.tilemap.electrical_components.keys())}")
+        debug_info.append(f"Electrical Components: {self.game_state.current_level.tilemap.get_electrical_positions()}")
         debug_info.append("")
         
         # Task System Information
@@ -111,18 +111,21 @@ class DebugUI:
             debug_info.append(state_str)
 
         # Render the debug information
+        texts = []
+        background_rects = []
         y_offset = self.position[1]
         for line in debug_info:
             text_surface = self.font.render(line, True, self.text_color)
-            text_rect = text_surface.get_rect()
-            text_rect.topleft = (self.position[0], y_offset)
-            
-            # Draw background
-            background_rect = text_rect.inflate(20, 5)
-            background_surface = pygame.Surface(background_rect.size, pygame.SRCALPHA)
-            background_surface.fill(self.background_color)
-            surface.blit(background_surface, background_rect.topleft)
-            
-            # Draw text
-            surface.blit(text_surface, text_rect)
-            y_offset += self.line_height 
\ No newline at end of file
+            text_rect = text_surface.get_rect(topleft=(self.position[0], y_offset))
+            texts.append((text_surface, text_rect))
+            background_rects.append(text_rect.inflate(20, 5))
+            y_offset += self.line_height
+        
+        # Draw every line background onto one translucent surface, then all
+        # text in a single batch
+        bounds = background_rects[0].unionall(background_rects)
+        background_surface = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        for rect in background_rects:
+            background_surface.fill(self.background_color, rect.move(-bounds.x, -bounds.y))
+        surface.blit(background_surface, bounds.topleft)
+        surface.blits(texts, doreturn=False)
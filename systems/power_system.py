@@ -50,7 +50,7 @@ class PowerSystem:
                 return True
                 
             # Add connected tiles we haven't visited
-            for tile in component.connected_tiles:
+            for tile in component.connected_tiles or ():
                 if tile not in visited:
                     to_visit.add(tile)
                     
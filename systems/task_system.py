@@ -1,8 +1,12 @@
 from dataclasses import dataclass
 from typing import Tuple, List, Optional
-from utils.types import Task, TaskType, EntityState
+import numpy as np
+from utils.types import Task, TaskType, EntityState, pack_tile, unpack_tile
 from components.base_entity import Entity
-from utils.config import TILE_SIZE
+from utils.config import TILE_SIZE, TILE_SIZE_LOG2
+
+TASK_GRID_SHIFT = 3  # Task grid buckets are 2**3 tiles per side
+TASK_GRID_CELL = 1 << TASK_GRID_SHIFT
 
 class TaskSystem:
     """
@@ -19,6 +23,74 @@ class TaskSystem:
         self.game_state = game_state
         self.available_tasks = []  # Tasks that haven't been assigned to any entity
         self.assigned_tasks = {}  # Change to dict with entity as key
+        self.active_workers = []  # TaskComponents currently holding a task
+        
+        # Spatial index over available_tasks: packed (cell_x, cell_y) key -> [Task]
+        self._task_grid = {}
+        self._priority_counts = {}  # priority -> number of tasks in the grid
+
+    def _grid_cell(self, position: Tuple[int, int]) -> int:
+        """Get the packed grid bucket key for a tile position"""
+        return pack_tile(position[0] >> TASK_GRID_SHIFT, position[1] >> TASK_GRID_SHIFT)
+
+    def _add_available(self, task: Task) -> None:
+        """Add a task to the available pool and the spatial grid"""
+        self.available_tasks.append(task)
+        self._task_grid.setdefault(self._grid_cell(task.position), []).append(task)
+        self._priority_counts[task.priority] = self._priority_counts.get(task.priority, 0) + 1
+
+    def remove_available(self, task: Task) -> None:
+        """Remove a task from the available pool and the spatial grid"""
+        if task not in self.available_tasks:
+            return
+        self.available_tasks.remove(task)
+        cell = self._grid_cell(task.position)
+        bucket = self._task_grid[cell]
+        bucket.remove(task)
+        if not bucket:
+            del self._task_grid[cell]
+        self._priority_counts[task.priority] -= 1
+        if not self._priority_counts[task.priority]:
+            del self._priority_counts[task.priority]
+
+    def register_worker(self, task_component) -> None:
+        """Track a task component that has started a task"""
+        if task_component not in self.active_workers:
+            self.active_workers.append(task_component)
+
+    def unregister_worker(self, task_component) -> None:
+        """Stop tracking a task component once its task ends"""
+        if task_component in self.active_workers:
+            self.active_workers.remove(task_component)
+
+    def batch_update(self) -> None:
+        """
+        Run the task range check for every active worker in one vectorized pass.
+        This runs before the level moves anyone, so each result is cached with
+        the position it was computed from; _is_at_task_position() only reuses it
+        if the worker hasn't moved since, which holds for workers at their task.
+        The sticky state is left for _is_at_task_position() to update.
+        """
+        # Drop workers whose entity was deactivated; it isn't updated any more,
+        # so its task component would never unregister itself
+        self.active_workers = [c for c in self.active_workers if c.entity.active]
+        workers = [c for c in self.active_workers if c.current_task and c._task_position]
+        if not workers:
+            return
+        
+        # Entity positions in tile units vs. task tiles
+        coords = [(c.entity.position.x, c.entity.position.y) for c in workers]
+        positions = np.array(coords) / TILE_SIZE
+        targets = np.array([c._task_position for c in workers], dtype=float)
+        manhattan_dist = np.abs(targets - positions).sum(axis=1)
+        
+        # Workers already in range get the sticky radius
+        radius = np.array([c.STICKY_RADIUS if c._last_in_range else c.WORKING_RADIUS for c in workers])
+        in_range = (manhattan_dist <= radius).tolist()
+        
+        frame = self.game_state.frame
+        for component, (x, y), is_in_range in zip(workers, coords, in_range):
+            component._in_range_cache = (frame, x, y, is_in_range)
 
     def add_task(self, type: TaskType, position: Tuple[int, int], priority: int = 1) -> Task:
         """
@@ -33,7 +105,7 @@ class TaskSystem:
             Task: The newly created task
         """
         task = Task(type=type, position=position, priority=priority)
-        self.available_tasks.append(task)
+        self._add_available(task)
         return task
 
     def get_available_task(self, entity):
@@ -42,24 +114,45 @@ class TaskSystem:
         if entity in self.assigned_tasks:
             return self.assigned_tasks[entity]
 
-        # Get available unassigned tasks
-        available_tasks = [t for t in self.available_tasks 
-                          if not t.is_assigned()]
-        if not available_tasks:
+        if not self._task_grid:
             return None
 
-        # Sort by distance and priority
-        sorted_tasks = sorted(
-            available_tasks,
-            key=lambda t: (
-                -t.priority,  # Higher priority first
-                (entity.position.x // TILE_SIZE - t.position[0]) ** 2 + 
-                (entity.position.y // TILE_SIZE - t.position[1]) ** 2
-            )
-        )
+        # Visit grid cells in rings around the entity, keeping the best task by
+        # (higher priority, shorter distance)
+        entity_tile = (int(entity.position.x) >> TILE_SIZE_LOG2, int(entity.position.y) >> TILE_SIZE_LOG2)
+        cell_x, cell_y = entity_tile[0] >> TASK_GRID_SHIFT, entity_tile[1] >> TASK_GRID_SHIFT
+        top_priority = max(self._priority_counts)
+        
+        # Ring index of each occupied cell, unpacking every key once
+        rings = []
+        for cell in self._task_grid:
+            x, y = unpack_tile(cell)
+            rings.append((max(abs(x - cell_x), abs(y - cell_y)), cell))
+        rings.sort(key=lambda ring_cell: ring_cell[0])
+        
+        task = None
+        best_key = None
+        for ring, cell in rings:
+            # Every task from this ring outward is at least this far away
+            min_dist = max(0, ring - 1) * TASK_GRID_CELL
+            if task and task.priority == top_priority and best_key[1] < min_dist * min_dist:
+                break
+            
+            for t in self._task_grid[cell]:
+                if t.is_assigned():
+                    continue
+                key = (
+                    -t.priority,  # Higher priority first
+                    (entity_tile[0] - t.position[0]) ** 2 + 
+                    (entity_tile[1] - t.position[1]) ** 2
+                )
+                if best_key is None or key < best_key:
+                    task, best_key = t, key
+
+        if not task:
+            return None
 
         # Return the best task but don't remove it yet
-        task = sorted_tasks[0]
         self.assigned_tasks[entity] = task
         return task
 
@@ -67,8 +160,7 @@ class TaskSystem:
         """Complete and remove a task from the system"""
         
         # Remove from available tasks if present
-        if task in self.available_tasks:
-            self.available_tasks.remove(task)
+        self.remove_available(task)
         
         # Remove from assigned tasks if present
         for entity, assigned_task in list(self.assigned_tasks.items()):
@@ -91,7 +183,7 @@ class TaskSystem:
         
         task.unassign()
         if task not in self.available_tasks:
-            self.available_tasks.append(task)
+            self._add_available(task)
     def get_highest_priority_task(self, entity) -> Optional[Task]:
         """
         Find the highest priority task from the available tasks pool.
@@ -135,6 +227,6 @@ class TaskSystem:
         
         # Mark task as assigned and add to tracking
         task.assigned_to = entity
-        self.available_tasks.remove(task)
+        self.remove_available(task)
         self.assigned_tasks[entity] = task
         return True 
\ No newline at end of file
@@ -1,13 +1,15 @@
+import logging
 import pygame
 from entities.alien import Alien
 from entities.cat import Cat
-from entities.enemies.base_enemy import BaseEnemy
 from systems.capture_system import CaptureState
 from utils.config import *
 from systems.ui.ui_elements import StylizedUIElements
 from systems.ui.mutation_ui import MutationMenu
 import math
 
+log = logging.getLogger(__name__)
+
 # Base class for all UI elements providing core functionality for visibility, 
 # event handling, and parent-child relationships
 class UIElement:
@@ -157,18 +159,17 @@ class HUD(UIElement):
         if not selected_alien:
             return
             
-        # Find nearest valid target
+        # Find nearest valid target, comparing squared distances
         nearest_target = None
-        min_distance = float('inf')
-        
-        for entity in self.game_state.current_level.entity_manager.entities:
-            if (isinstance(entity, BaseEnemy) and 
-                hasattr(entity, 'capture_state') and 
-                entity.capture_state == CaptureState.NONE):
-                
-                distance = (entity.position - selected_alien.position).length()
-                if distance < min_distance and distance <= selected_alien.capture_range:
-                    min_distance = distance
+        min_distance_sq = float('inf')
+        capture_range_sq = selected_alien.capture_range ** 2
+        alien_position = selected_alien.position
+        
+        for entity in self.game_state.current_level.entity_manager.enemies:
+            if entity.capture_state == CaptureState.NONE:
+                distance_sq = alien_position.distance_squared_to(entity.position)
+                if distance_sq < min_distance_sq and distance_sq <= capture_range_sq:
+                    min_distance_sq = distance_sq
                     nearest_target = entity
                     
         if nearest_target:
@@ -205,12 +206,12 @@ class HUD(UIElement):
                 self.release_button.visible = True
             else:
                 # Check if any valid targets are in range
+                alien_position = selected_alien.position
+                capture_range_sq = selected_alien.capture_range ** 2
                 has_target_in_range = any(
-                    isinstance(entity, BaseEnemy) and
-                    hasattr(entity, 'capture_state') and
                     entity.capture_state == CaptureState.NONE and
-                    (entity.position - selected_alien.position).length() <= selected_alien.capture_range
-                    for entity in self.game_state.current_level.entity_manager.entities
+                    alien_position.distance_squared_to(entity.position) <= capture_range_sq
+                    for entity in self.game_state.current_level.entity_manager.enemies
                 )
                 self.capture_button.visible = has_target_in_range
                 self.release_button.visible = False
@@ -465,7 +466,7 @@ class BuildUI(UIElement):
             self.reactor_btn.visible = False
             self.life_support_btn.visible = False
         
-        print(f"Build menu {'opened' if self.is_menu_open else 'closed'}")
+        log.debug("Build menu %s", 'opened' if self.is_menu_open else 'closed')
 
     def toggle_power_menu(self):
         """Toggle the power submenu"""
@@ -1,12 +1,17 @@
 import pygame
+import numpy as np
 from components.base_entity import Entity
-from utils.types import TaskType, Task
+from utils.types import TaskType, Task, pack_tile
 from utils.config import *
 from core.tiles import ElectricalComponent
 from dataclasses import dataclass
 from typing import Optional, Tuple, List
 from enum import Enum
 
+# Bound once for the ghost preview loop in WireSystem.draw
+_draw_line = pygame.draw.line
+_draw_circle = pygame.draw.circle
+
 @dataclass
 class Task:
     """Represents a game task that can be assigned to entities"""
@@ -44,7 +49,19 @@ class WireSystem:
         self.ghost_valid = False
         self.start_position = None
         self.current_wire_path = []
-        self.construction_progress = {}  # Track progress per wire position
+        
+        # Construction clock, advanced by tick()
+        self.time = 0.0
+        
+        # Construction state for wires being built, one array slot per wire. Each
+        # wire finishes at its deadline; frames nobody works on it push it back
+        self._slot_of = {}  # Packed wire position key -> slot
+        self._slot_positions = []  # Slot -> wire position (None when free)
+        self._free_slots = []
+        self._deadline = np.zeros(0)
+        self._last_worked = np.zeros(0)  # Clock time at the end of the last worked frame
+        self._work_time = np.zeros(0)
+        self._worked = np.zeros(0, dtype=bool)  # Slots worked on this frame
         
     def handle_event(self, event):
         """
@@ -142,14 +159,10 @@ class WireSystem:
             # Create wire component with proper initialization
             component = ElectricalComponent(
                 type='wire',
-                _under_construction=True,
-                _is_built=False
+                under_construction=True,
+                is_built=False
             )
             
-            # Explicitly set properties
-            component.under_construction = True
-            component.is_built = False
-            
             # Place in tilemap
             tilemap = self.game_state.current_level.tilemap
             success = tilemap.set_electrical(pos[0], pos[1], component)
@@ -179,8 +192,7 @@ class WireSystem:
             return False
         
         # Clear construction progress
-        if position in self.construction_progress:
-            del self.construction_progress[position]
+        self._release_slot(position)
         
         # Pass both position and wire component to update connections
         self._update_wire_connections(position, wire)
@@ -194,32 +206,94 @@ class WireSystem:
         # Create new wire component
         wire = ElectricalComponent(
             type='wire',
-            _under_construction=True,  # Use the actual field name with underscore
-            _is_built=False           # Use the actual field name with underscore
+            under_construction=True,
+            is_built=False
         )
         
         # Add to tilemap
-        self.game_state.current_level.tilemap.electrical_components[position] = wire
+        self.game_state.current_level.tilemap.set_electrical(position[0], position[1], wire)
         return True
 
-    def update_construction_progress(self, position: tuple[int, int], dt: float) -> bool:
-        """Update construction progress for a wire"""
+    def work_on(self, position: tuple[int, int], work_time: float) -> bool:
+        """Mark a wire as being worked on this frame; tick() advances it"""
         wire = self.game_state.current_level.tilemap.get_electrical(position[0], position[1])
-        if not wire:
+        if not wire or not getattr(wire, 'under_construction', False):
             return False
-    
         
-        if not hasattr(wire, '_under_construction') or not wire._under_construction:
-            return False
+        slot = self._slot_of.get(pack_tile(position[0], position[1]))
+        if slot is None:
+            slot = self._claim_slot(position, work_time)
+        self._worked[slot] = True
+        return True
+
+    def tick(self, dt: float) -> None:
+        """Advance the construction clock, completing wires past their deadline"""
+        now = self.time
+        self.time = now + dt
         
-        # Add progress tracking
-        if position not in self.construction_progress:
-            self.construction_progress[position] = 0.0
+        worked = self._worked
+        if not worked.any():
+            return
         
-        old_progress = self.construction_progress[position]
-        self.construction_progress[position] += dt
+        # Wires picked back up after a stall get their deadline pushed back
+        stalled = worked & (self._last_worked < now)
+        self._deadline[stalled] += now - self._last_worked[stalled]
+        self._last_worked[worked] = self.time
         
-        return True
+        done = np.nonzero(worked & (self._deadline <= self.time))[0]
+        worked[:] = False
+        
+        for slot in done.tolist():
+            self.complete_wire_construction(self._slot_positions[slot])
+
+    def get_construction_progress(self, position: tuple[int, int]) -> float:
+        """Get accumulated construction time for a wire"""
+        slot = self._slot_of.get(pack_tile(position[0], position[1]))
+        if slot is None:
+            return 0.0
+        return float(self._work_time[slot] - (self._deadline[slot] - self._last_worked[slot]))
+
+    def clear_construction(self) -> None:
+        """Drop all construction progress, e.g. when the level's tilemap is replaced"""
+        self._slot_of.clear()
+        self._slot_positions = [None] * len(self._slot_positions)
+        self._free_slots = list(range(len(self._slot_positions) - 1, -1, -1))
+        self._worked[:] = False
+
+    def _claim_slot(self, position: tuple[int, int], work_time: float) -> int:
+        """Give a wire a construction slot, growing the arrays when none are free"""
+        if not self._free_slots:
+            size = len(self._slot_positions)
+            grow = max(size, 16)
+            self._deadline = np.concatenate((self._deadline, np.zeros(grow)))
+            self._last_worked = np.concatenate((self._last_worked, np.zeros(grow)))
+            self._work_time = np.concatenate((self._work_time, np.zeros(grow)))
+            self._worked = np.concatenate((self._worked, np.zeros(grow, dtype=bool)))
+            self._slot_positions.extend([None] * grow)
+            self._free_slots.extend(range(size + grow - 1, size - 1, -1))
+        
+        slot = self._free_slots.pop()
+        self._slot_of[pack_tile(position[0], position[1])] = slot
+        self._slot_positions[slot] = position
+        self._deadline[slot] = self.time + work_time
+        self._last_worked[slot] = self.time
+        self._work_time[slot] = work_time
+        self._worked[slot] = False
+        return slot
+
+    def _release_slot(self, position: tuple[int, int]) -> None:
+        """Return a wire's progress slot to the free list"""
+        slot = self._slot_of.pop(pack_tile(position[0], position[1]), None)
+        if slot is None:
+            return
+        self._slot_positions[slot] = None
+        self._worked[slot] = False
+        self._free_slots.append(slot)
+
+    def is_wire_built(self, position: tuple[int, int]) -> bool:
+        """Check if the wire at a position has finished construction"""
+        wire = self.game_state.current_level.tilemap.get_electrical(position[0], position[1])
+        return bool(wire and wire.is_built)
 
     def complete_construction(self, position: tuple[int, int]) -> None:
         """Mark a wire as fully constructed"""
@@ -234,7 +308,7 @@ class WireSystem:
         tilemap = self.game_state.current_level.tilemap
         
         # Initialize connected_tiles if needed
-        if not hasattr(wire_component, 'connected_tiles'):
+        if getattr(wire_component, 'connected_tiles', None) is None:
             wire_component.connected_tiles = []
         
         # Check adjacent tiles for other wires or electrical components
@@ -244,7 +318,7 @@ class WireSystem:
             adj_comp = tilemap.get_electrical(adj_pos[0], adj_pos[1])
             if adj_comp and hasattr(adj_comp, 'is_built') and adj_comp.is_built:
                 # Initialize connected_tiles if needed
-                if not hasattr(adj_comp, 'connected_tiles'):
+                if getattr(adj_comp, 'connected_tiles', None) is None:
                     adj_comp.connected_tiles = []
                 
                 # Add mutual connections if they don't exist
@@ -253,9 +327,8 @@ class WireSystem:
                 if adj_pos not in wire_component.connected_tiles:
                     wire_component.connected_tiles.append(adj_pos)
         
-        # After updating connections, trigger power system update
-        if hasattr(self.game_state, 'power_system'):
-            self.game_state.power_system.update()
+        # No power recompute here: GameState.update runs the power system once
+        # per frame after entities update, which picks up these connections
 
     def draw(self, surface):
         """Only renders ghost wire previews"""
@@ -267,32 +340,44 @@ class WireSystem:
                 self.ghost_position[0], self.ghost_position[1]
             )
             
+            zoom_level = self.game_state.zoom_level
+            camera_x = self.game_state.camera_x
+            camera_y = self.game_state.camera_y
+            tile_size = TILE_SIZE * zoom_level
+            surface_width, surface_height = surface.get_size()
+            
+            # Draw ghost wire in semi-transparent white
+            wire_color = (255, 255, 255, 128)
+            wire_width = int(max(2 * zoom_level, 1))
+            node_radius = int(max(3 * zoom_level, 2))
+            
             # Draw each position in the ghost line
+            draw_line = _draw_line
+            draw_circle = _draw_circle
+            is_valid_wire_position = self._is_valid_wire_position
             for pos in positions:
-                if not self._is_valid_wire_position(pos[0], pos[1]):
+                screen_x = (pos[0] * TILE_SIZE - camera_x) * zoom_level
+                screen_y = (pos[1] * TILE_SIZE - camera_y) * zoom_level
+                
+                # Skip tiles that are fully off-screen
+                if (screen_x + tile_size < 0 or screen_x > surface_width or
+                        screen_y + tile_size < 0 or screen_y > surface_height):
                     continue
                 
-                screen_x = (pos[0] * TILE_SIZE - self.game_state.camera_x) * self.game_state.zoom_level
-                screen_y = (pos[1] * TILE_SIZE - self.game_state.camera_y) * self.game_state.zoom_level
-                tile_size = TILE_SIZE * self.game_state.zoom_level
+                if not is_valid_wire_position(pos[0], pos[1]):
+                    continue
                 
-                # Draw ghost wire in semi-transparent white
-                wire_color = (255, 255, 255, 128)
+                left = screen_x + tile_size * 0.2
+                right = screen_x + tile_size * 0.8
+                middle = screen_y + tile_size * 0.5
                 
                 # Draw main wire line
-                pygame.draw.line(surface, wire_color,
-                               (screen_x + tile_size * 0.2, screen_y + tile_size * 0.5),
-                               (screen_x + tile_size * 0.8, screen_y + tile_size * 0.5),
-                               int(max(2 * self.game_state.zoom_level, 1)))
+                draw_line(surface, wire_color, (left, middle), (right, middle), wire_width)
                 
                 # Draw connection nodes
-                node_radius = max(3 * self.game_state.zoom_level, 2)
-                pygame.draw.circle(surface, wire_color,
-                                 (int(screen_x + tile_size * 0.2), int(screen_y + tile_size * 0.5)),
-                                 int(node_radius))
-                pygame.draw.circle(surface, wire_color,
-                                 (int(screen_x + tile_size * 0.8), int(screen_y + tile_size * 0.5)),
-                                 int(node_radius))
+                node_y = int(middle)
+                draw_circle(surface, wire_color, (int(left), node_y), node_radius)
+                draw_circle(surface, wire_color, (int(right), node_y), node_radius)
 
     def _is_valid_wire_position(self, x, y):
         """
@@ -306,7 +391,7 @@ class WireSystem:
                 0 <= y < self.game_state.current_level.tilemap.height):
             return False
         
-        if (x, y) in self.game_state.current_level.tilemap.electrical_components:
+        if self.game_state.current_level.tilemap.has_electrical.item(y, x):
             return False
         
         return True 
\ No newline at end of file
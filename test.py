@@ -1,4 +1,5 @@
 import pygame
+import numpy as np
 from components.base_entity import Entity
 from components.movement_component import MovementComponent
 from components.alien_render_component import AlienRenderComponent
@@ -27,6 +28,15 @@ class TestTilemap:
                 return False
         return False
 
+    def is_walkable_unchecked(self, x: int, y: int) -> bool:
+        """Check walkability for coordinates already known to be in bounds"""
+        return self.tiles[x][y]
+
+    def walkable_mask(self, xs, ys):
+        """Check walkability for arrays of coordinates"""
+        xs, ys = np.broadcast_arrays(xs, ys)
+        return np.vectorize(self.is_walkable, otypes=[bool])(xs, ys)
+
     def render(self, surface, camera_x: float, camera_y: float) -> None:
         """Draw walls and grid"""
         # Draw grid
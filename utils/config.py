@@ -6,8 +6,18 @@ GAME_TITLE = "Altered"
 
 # Tile settings
 TILE_SIZE = 32
+TILE_SIZE_LOG2 = TILE_SIZE.bit_length() - 1  # Shift for pixel <-> tile conversion
+assert TILE_SIZE == 1 << TILE_SIZE_LOG2, "TILE_SIZE must be a power of two"
 MAP_WIDTH = 100
 MAP_HEIGHT = 100
+TILE_KEY_SHIFT = 16  # Packed tile keys are (y << 16) | x
+TILE_KEY_MASK = (1 << TILE_KEY_SHIFT) - 1
+
+# Pathfinding settings
+PATHFINDING_BIDI_THRESHOLD = 50  # Manhattan tile distance above which bidirectional A* is used
+
+# Debug settings
+DEBUG_DRAW_PATHS = False  # Draw pathfinding routes over the map
 
 # Colors (RGB)
 BLACK = (0, 0, 0)
@@ -17,3 +27,4 @@ WHITE = (255, 255, 255)
 MIN_ZOOM = 0.5  # Maximum zoom out (half size)
 MAX_ZOOM = 2.0  # Maximum zoom in (double size)
 ZOOM_SPEED = 0.1  # How much to zoom per scroll
+GRID_VISIBLE_ZOOM = 1.0  # Tile grid lines are only drawn at or above this zoom
@@ -1,7 +1,12 @@
 from typing import List, Tuple, Set, Dict, Optional
 from queue import PriorityQueue
+import heapq
 
-from utils.config import TILE_SIZE
+import numpy as np
+
+from utils.config import TILE_SIZE_LOG2
+
+END_SEARCH_RADIUS = 5  # Tiles to look around an unwalkable target for a walkable one
 
 class PathReservationSystem:
     """Manages path reservations to prevent entity collisions"""
@@ -52,6 +57,32 @@ class PathReservationSystem:
             return False
         return self.reserved_tiles[tile] != entity
 
+class WalkableGrid:
+    """Read-only copy of a tilemap's walkable grid, for searching off the main thread"""
+    __slots__ = ('walkable', 'width', 'height')
+
+    def __init__(self, walkable: np.ndarray):
+        self.walkable = walkable
+        self.height, self.width = walkable.shape
+
+    def is_walkable(self, x: int, y: int) -> bool:
+        """Check if a tile can be walked on"""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        return self.walkable.item(y, x)
+
+    def is_walkable_unchecked(self, x: int, y: int) -> bool:
+        """Like is_walkable, for callers that have already bounds-checked x and y"""
+        return self.walkable.item(y, x)
+
+    def walkable_mask(self, xs, ys) -> np.ndarray:
+        """Vectorized is_walkable; out-of-bounds tiles aren't walkable"""
+        xs, ys = np.broadcast_arrays(xs, ys)
+        inside = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        mask = np.zeros(xs.shape, dtype=bool)
+        mask[inside] = self.walkable[ys[inside], xs[inside]]
+        return mask
+
 def manhattan_distance(a: Tuple[int, int], b: Tuple[int, int]) -> float:
     """Calculate Manhattan distance between two points"""
     return abs(a[0] - b[0]) + abs(a[1] - b[1])
@@ -69,53 +100,87 @@ def get_neighbors(pos: Tuple[int, int], tilemap) -> List[Tuple[int, int]]:
             
     return neighbors
 
-def find_path(start: Tuple[int, int], end: Tuple[int, int], tilemap, game_state=None, entity=None) -> Optional[List[Tuple[int, int]]]:
-    """A* pathfinding with entity collision avoidance"""
-    
-    def is_tile_occupied(tile: Tuple[int, int]) -> bool:
-        """Check if a tile is occupied by any entity except the moving one"""
-        if not game_state:
-            return False
-            
-        for other in game_state.entity_manager.entities:
-            if other == entity:
-                continue
-            other_tile = (
-                int(other.position.x // TILE_SIZE),
-                int(other.position.y // TILE_SIZE)
-            )
-            if (other_tile == tile and 
-                (tile == end or tile != (int(entity.position.x // TILE_SIZE),
-                                       int(entity.position.y // TILE_SIZE)))):
-                return True
+def _is_tile_occupied(tile: Tuple[int, int], end: Tuple[int, int], game_state, entity, occupied=None) -> bool:
+    """
+    Check if a tile is occupied by any entity except the moving one.
+    occupied, if given, is a snapshot of the tiles that block the mover and is
+    used instead of reading live entity positions.
+    """
+    if occupied is not None:
+        return tile in occupied
+    if not game_state:
         return False
-
-    def get_neighbors(pos: Tuple[int, int]) -> List[Tuple[int, int]]:
-        """Get valid neighboring tiles"""
-        x, y = pos
-        neighbors = []
         
-        # Check cardinal directions first
-        for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+    for other in game_state.entity_manager.entities:
+        if other == entity:
+            continue
+        other_tile = (
+            int(other.position.x) >> TILE_SIZE_LOG2,
+            int(other.position.y) >> TILE_SIZE_LOG2
+        )
+        if (other_tile == tile and 
+            (tile == end or tile != (int(entity.position.x) >> TILE_SIZE_LOG2,
+                                   int(entity.position.y) >> TILE_SIZE_LOG2))):
+            return True
+    return False
+
+def _get_open_neighbors(pos: Tuple[int, int], end: Tuple[int, int], tilemap, game_state, entity, occupied=None) -> List[Tuple[int, int]]:
+    """Get walkable, unoccupied neighbors, falling back to diagonals when boxed in"""
+    # Bounds are checked here, so the walkability lookups can skip them
+    x, y = pos
+    neighbors = []
+    
+    # Check cardinal directions first
+    for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+        next_x, next_y = x + dx, y + dy
+        if (0 <= next_x < tilemap.width and 
+            0 <= next_y < tilemap.height and 
+            tilemap.is_walkable_unchecked(next_x, next_y) and
+            not _is_tile_occupied((next_x, next_y), end, game_state, entity, occupied)):
+            neighbors.append((next_x, next_y))
+            
+    # If no valid cardinal moves, try diagonals
+    if not neighbors:
+        for dx, dy in [(1, 1), (-1, 1), (1, -1), (-1, -1)]:
             next_x, next_y = x + dx, y + dy
             if (0 <= next_x < tilemap.width and 
                 0 <= next_y < tilemap.height and 
-                tilemap.is_walkable(next_x, next_y) and
-                not is_tile_occupied((next_x, next_y))):
+                tilemap.is_walkable_unchecked(next_x, next_y) and
+                not _is_tile_occupied((next_x, next_y), end, game_state, entity, occupied)):
                 neighbors.append((next_x, next_y))
-                
-        # If no valid cardinal moves, try diagonals
-        if not neighbors:
-            for dx, dy in [(1, 1), (-1, 1), (1, -1), (-1, -1)]:
-                next_x, next_y = x + dx, y + dy
-                if (0 <= next_x < tilemap.width and 
-                    0 <= next_y < tilemap.height and 
-                    tilemap.is_walkable(next_x, next_y) and
-                    not is_tile_occupied((next_x, next_y))):
-                    neighbors.append((next_x, next_y))
-        
-        return neighbors
+    
+    return neighbors
+
+def _is_open(tile: Tuple[int, int], end: Tuple[int, int], tilemap, game_state, entity, occupied=None) -> bool:
+    """Check if a tile is in bounds, walkable and unoccupied"""
+    x, y = tile
+    return (0 <= x < tilemap.width and 
+            0 <= y < tilemap.height and 
+            tilemap.is_walkable_unchecked(x, y) and
+            not _is_tile_occupied(tile, end, game_state, entity, occupied))
+
+def _get_open_predecessors(pos: Tuple[int, int], end: Tuple[int, int], tilemap, game_state, entity, occupied=None) -> List[Tuple[int, int]]:
+    """
+    Get tiles that _get_open_neighbors would step from onto pos, for searching
+    backward. A diagonal step is only taken from a tile that is boxed in, so a
+    diagonal predecessor must itself have no open cardinal neighbors.
+    """
+    x, y = pos
+    cardinals = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+    neighbors = [(x + dx, y + dy) for dx, dy in cardinals
+                 if _is_open((x + dx, y + dy), end, tilemap, game_state, entity, occupied)]
+    
+    for dx, dy in [(1, 1), (-1, 1), (1, -1), (-1, -1)]:
+        prev = (x + dx, y + dy)
+        if (_is_open(prev, end, tilemap, game_state, entity, occupied) and
+            not any(_is_open((prev[0] + cx, prev[1] + cy), end, tilemap, game_state, entity, occupied)
+                    for cx, cy in cardinals)):
+            neighbors.append(prev)
+    
+    return neighbors
 
+def _resolve_endpoints(start: Tuple[int, int], end: Tuple[int, int], tilemap) -> Optional[Tuple[int, int]]:
+    """Validate the search endpoints, returning a walkable end tile or None"""
     # Early exit for invalid inputs
     if not tilemap or not start or not end:
         return None
@@ -126,20 +191,36 @@ def find_path(start: Tuple[int, int], end: Tuple[int, int], tilemap, game_state=
         
     # Find nearest walkable end position if needed
     if not tilemap.is_walkable(*end):
-        # Search in expanding radius for walkable tile
-        for radius in range(1, 6):  # Try up to 5 tiles away
-            for dx in range(-radius, radius + 1):
-                for dy in range(-radius, radius + 1):
-                    test_pos = (end[0] + dx, end[1] + dy)
-                    if tilemap.is_walkable(*test_pos):
-                        end = test_pos
-                        break
-                if tilemap.is_walkable(*end):
-                    break
-            if tilemap.is_walkable(*end):
+        # Query the whole search area at once, indexed [dx, dy]
+        offsets = np.arange(-END_SEARCH_RADIUS, END_SEARCH_RADIUS + 1)
+        walkable = tilemap.walkable_mask(end[0] + offsets[:, None], end[1] + offsets[None, :])
+        
+        # Search in expanding radius for walkable tile, taking the first one
+        # in dx-then-dy order within each square
+        for radius in range(1, END_SEARCH_RADIUS + 1):
+            square = walkable[END_SEARCH_RADIUS - radius:END_SEARCH_RADIUS + radius + 1,
+                              END_SEARCH_RADIUS - radius:END_SEARCH_RADIUS + radius + 1]
+            if square.any():
+                dx, dy = divmod(int(square.argmax()), 2 * radius + 1)
+                end = (end[0] + dx - radius, end[1] + dy - radius)
                 break
         else:
             return None
+            
+    return end
+
+def _reserve(path: List[Tuple[int, int]], path_system, entity) -> Optional[List[Tuple[int, int]]]:
+    """Try to reserve path if system exists"""
+    if path_system and entity:
+        if not path_system.reserve_path(entity, path):
+            return None
+    return path
+
+def find_path(start: Tuple[int, int], end: Tuple[int, int], tilemap, game_state=None, entity=None) -> Optional[List[Tuple[int, int]]]:
+    """A* pathfinding with entity collision avoidance"""
+    end = _resolve_endpoints(start, end, tilemap)
+    if end is None:
+        return None
 
     # Initialize A* algorithm
     frontier = PriorityQueue()
@@ -157,7 +238,7 @@ def find_path(start: Tuple[int, int], end: Tuple[int, int], tilemap, game_state=
         if current == end:
             break
             
-        for next_pos in get_neighbors(current):
+        for next_pos in _get_open_neighbors(current, end, tilemap, game_state, entity):
             # Skip if tile is reserved by another entity
             if path_system and path_system.is_tile_reserved(next_pos, entity):
                 continue
@@ -180,9 +261,89 @@ def find_path(start: Tuple[int, int], end: Tuple[int, int], tilemap, game_state=
         current = came_from[current]
     path.reverse()
     
-    # Try to reserve path if system exists
-    if path_system and entity:
-        if not path_system.reserve_path(entity, path):
-            return None
-    
-    return path 
\ No newline at end of file
+    return _reserve(path, path_system, entity)
+
+def find_path_bidi(start: Tuple[int, int], end: Tuple[int, int], tilemap, game_state=None, entity=None,
+                   occupied=None, reserve: bool = True, reserved=None) -> Optional[List[Tuple[int, int]]]:
+    """
+    Bidirectional A* with the same semantics as find_path.
+    Expands forward from start and backward from end, alternating sides,
+    and stops once neither frontier can improve on the best meeting point.
+    Explores roughly half the nodes of find_path on long, open routes.
+    Background searches pass a WalkableGrid, snapshots of the occupied tiles
+    and of the tiles reserved by other entities, no game_state and
+    reserve=False, and reserve the path on the main thread instead.
+    """
+    end = _resolve_endpoints(start, end, tilemap)
+    if end is None:
+        return None
+
+    # Get path reservation system if available
+    path_system = getattr(game_state, 'path_reservation_system', None) if game_state else None
+
+    if start == end:
+        return _reserve([start], path_system, entity) if reserve else [start]
+
+    # Per-direction state: open heap, g-scores, parent links, heuristic goal
+    open_f = [(manhattan_distance(start, end), 0, start)]
+    open_b = [(manhattan_distance(end, start), 0, end)]
+    g_f = {start: 0}
+    g_b = {end: 0}
+    parent_f = {start: None}
+    parent_b = {end: None}
+
+    best_cost = float('inf')
+    meeting = None
+
+    while open_f and open_b:
+        # Neither frontier can produce a shorter path than the current best
+        if max(open_f[0][0], open_b[0][0]) >= best_cost:
+            break
+
+        # Expand the smaller frontier to keep both searches balanced
+        if len(open_f) <= len(open_b):
+            heap, g_this, parent_this, g_other, goal = open_f, g_f, parent_f, g_b, end
+            expand = _get_open_neighbors
+        else:
+            heap, g_this, parent_this, g_other, goal = open_b, g_b, parent_b, g_f, start
+            expand = _get_open_predecessors
+
+        _, g, current = heapq.heappop(heap)
+        if g > g_this[current]:
+            continue  # Stale heap entry
+
+        for next_pos in expand(current, end, tilemap, game_state, entity, occupied):
+            # Skip if tile is reserved by another entity
+            if reserved is not None:
+                if next_pos in reserved:
+                    continue
+            elif path_system and path_system.is_tile_reserved(next_pos, entity):
+                continue
+
+            new_cost = g + 1
+            if next_pos not in g_this or new_cost < g_this[next_pos]:
+                g_this[next_pos] = new_cost
+                parent_this[next_pos] = current
+                heapq.heappush(heap, (new_cost + manhattan_distance(next_pos, goal), new_cost, next_pos))
+
+                # Record the cheapest tile reached from both sides
+                if next_pos in g_other and new_cost + g_other[next_pos] < best_cost:
+                    best_cost = new_cost + g_other[next_pos]
+                    meeting = next_pos
+
+    if meeting is None:
+        return None
+
+    # Stitch start -> meeting and meeting -> end
+    path = []
+    current = meeting
+    while current is not None:
+        path.append(current)
+        current = parent_f[current]
+    path.reverse()
+    current = parent_b[meeting]
+    while current is not None:
+        path.append(current)
+        current = parent_b[current]
+
+    return _reserve(path, path_system, entity) if reserve else path
@@ -1,6 +1,15 @@
 from enum import Enum, auto
 from dataclasses import dataclass
 from typing import Optional, Tuple
+from utils.config import TILE_KEY_SHIFT, TILE_KEY_MASK
+
+def pack_tile(x: int, y: int) -> int:
+    """Pack non-negative tile coordinates into a single int dict key"""
+    return (y << TILE_KEY_SHIFT) | x
+
+def unpack_tile(key: int) -> Tuple[int, int]:
+    """Unpack a key made by pack_tile back into (x, y)"""
+    return (key & TILE_KEY_MASK, key >> TILE_KEY_SHIFT)
 
 class TaskType(Enum):
     """Defines the different types of tasks that entities can perform in the game."""
@@ -26,7 +35,7 @@ class Task:
     position: Tuple[int, int]
     priority: int = 1
     completed: bool = False
-    work_time: float = 2.0
+    work_time: float = 1.0  # Seconds of building, counted once per frame
     assigned_to: Optional[int] = None  # This stores the entity's ID directly
     _work_progress: float = 0.0  # Add this line to track progress
 